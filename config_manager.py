@@ -1,5 +1,5 @@
 import configparser
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, TextIO, ClassVar
 import os
 import logging
 from dataclasses import dataclass
@@ -35,6 +35,14 @@ class LLMConfig:
     enable_structured_outputs: bool = True  # Whether to use structured outputs feature
     enable_streaming: bool = True  # Whether to enable streaming responses for more lifelike Oracle interactions
 
+    # Safe ranges (inclusive) and the value used when a setting falls outside them
+    MAX_TOKENS_RANGE: ClassVar[tuple] = (1, 4000)
+    DEFAULT_MAX_TOKENS: ClassVar[int] = 500
+    TIMEOUT_SECONDS_RANGE: ClassVar[tuple] = (1, 120)
+    DEFAULT_TIMEOUT_SECONDS: ClassVar[int] = 30
+    DAILY_REQUEST_LIMIT_RANGE: ClassVar[tuple] = (0, 1000) # 0 = unlimited
+    DEFAULT_DAILY_REQUEST_LIMIT: ClassVar[int] = 100
+
     def __post_init__(self):
         """Validate and finalize configuration after initialization."""
         if self.api_key and self.api_key.strip() and self.api_key not in ["YOUR_API_KEY_HERE", "testkey123", "None", ""]:
@@ -45,17 +53,30 @@ class LLMConfig:
                  logger.info(f"API key is a placeholder or empty: \'{self.api_key}\'")
         
         # Validate safety limits
-        if self.max_tokens <= 0 or self.max_tokens > 4000:
-            logger.warning(f"max_tokens value {self.max_tokens} is outside safe range (1-4000). Using 500.")
-            self.max_tokens = 500
+        low, high = self.MAX_TOKENS_RANGE
+        if not low <= self.max_tokens <= high:
+            logger.warning(f"max_tokens value {self.max_tokens} is outside safe range ({low}-{high}). Using {self.DEFAULT_MAX_TOKENS}.")
+            self.max_tokens = self.DEFAULT_MAX_TOKENS
             
-        if self.timeout_seconds <= 0 or self.timeout_seconds > 120:
-            logger.warning(f"timeout_seconds value {self.timeout_seconds} is outside safe range (1-120). Using 30.")
-            self.timeout_seconds = 30
+        low, high = self.TIMEOUT_SECONDS_RANGE
+        if not low <= self.timeout_seconds <= high:
+            logger.warning(f"timeout_seconds value {self.timeout_seconds} is outside safe range ({low}-{high}). Using {self.DEFAULT_TIMEOUT_SECONDS}.")
+            self.timeout_seconds = self.DEFAULT_TIMEOUT_SECONDS
             
-        if self.daily_request_limit < 0 or self.daily_request_limit > 1000:
-            logger.warning(f"daily_request_limit value {self.daily_request_limit} is outside safe range (0-1000, 0=unlimited). Using 100.")
-            self.daily_request_limit = 100
+        low, high = self.DAILY_REQUEST_LIMIT_RANGE
+        if not low <= self.daily_request_limit <= high:
+            logger.warning(f"daily_request_limit value {self.daily_request_limit} is outside safe range ({low}-{high}, 0=unlimited). Using {self.DEFAULT_DAILY_REQUEST_LIMIT}.")
+            self.daily_request_limit = self.DEFAULT_DAILY_REQUEST_LIMIT
+
+# Environment variable holding each provider's API key; built once at import
+_PROVIDER_ENV: Dict[str, str] = {
+    "xai": "XAI_API_KEY",
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "groq": "GROQ_API_KEY",
+    "together": "TOGETHER_API_KEY",
+    "perplexity": "PERPLEXITY_API_KEY"
+}
 
 def get_api_key_from_env(provider: str) -> Optional[str]:
     """Get API key from environment variables based on provider.
@@ -66,16 +87,7 @@ def get_api_key_from_env(provider: str) -> Optional[str]:
     Returns:
         The API key from environment variables, or None if not found
     """
-    env_var_map = {
-        "xai": "XAI_API_KEY",
-        "openai": "OPENAI_API_KEY", 
-        "anthropic": "ANTHROPIC_API_KEY",
-        "groq": "GROQ_API_KEY",
-        "together": "TOGETHER_API_KEY",
-        "perplexity": "PERPLEXITY_API_KEY"
-    }
-    
-    env_var = env_var_map.get(provider.lower())
+    env_var = _PROVIDER_ENV.get(provider.lower())
     if env_var:
         api_key = os.getenv(env_var)
         if api_key:
@@ -118,7 +130,7 @@ def detect_provider_from_model(model_name: str) -> str:
         logger.warning(f"Could not auto-detect provider for model '{model_name}', defaulting to openai")
         return "openai"
 
-def load_llm_config(config_file_name: str = DEFAULT_CONFIG_FILENAME) -> LLMConfig:
+def load_llm_config(config_file_name: str = DEFAULT_CONFIG_FILENAME, *, fp: Optional[TextIO] = None) -> LLMConfig:
     """Loads LLM configuration from the specified .ini file.
 
     Reads model name, provider, and other settings from the [LLM] section.
@@ -127,6 +139,9 @@ def load_llm_config(config_file_name: str = DEFAULT_CONFIG_FILENAME) -> LLMConfi
     Args:
         config_file_name (str): The name of the configuration file.
                                 Defaults to "llm_config.ini".
+        fp (Optional[TextIO]): An already-open file-like object to parse instead
+                               of reading `config_file_name` from disk (e.g. an
+                               `io.StringIO` in tests). Defaults to None.
 
     Returns:
         LLMConfig: An instance of LLMConfig populated with settings from the file.
@@ -134,25 +149,30 @@ def load_llm_config(config_file_name: str = DEFAULT_CONFIG_FILENAME) -> LLMConfi
     """
     parser = configparser.ConfigParser()
     
-    # Construct path relative to this file's directory
-    config_file_path = os.path.join(PACKAGE_ROOT_DIR, config_file_name)
-    
-    logger.info(f"Attempting to load config from: {config_file_path}")
+    if fp is not None:
+        # Only used to label log messages below
+        config_file_path = getattr(fp, "name", "<stream>")
+        parser.read_file(fp)
+    else:
+        # Construct path relative to this file's directory
+        config_file_path = os.path.join(PACKAGE_ROOT_DIR, config_file_name)
 
-    try:
-        with open(config_file_path, 'r') as f:
-            parser.read_file(f)
-    except FileNotFoundError:
-        logger.info(f"Configuration file '{config_file_path}' not found. LLM features may be unavailable.")
-        example_config_path = os.path.join(PACKAGE_ROOT_DIR, "llm_config.ini.example")
-        if os.path.exists(example_config_path):
-            logger.info(f"Configuration file '{config_file_name}' not found.")
-            logger.info(f"To enable LLM features, please copy '{example_config_path}' to '{config_file_path}' and set your API keys in environment variables.")
-            logger.info("See README.md for more details.")
-        else:
-            logger.info(f"Configuration file '{config_file_name}' not found and no example configuration was found.")
-            logger.info("LLM features will be disabled. See README.md for manual configuration instructions if you wish to use them.")
-        return LLMConfig() 
+        logger.info(f"Attempting to load config from: {config_file_path}")
+
+        try:
+            with open(config_file_path, 'r') as f:
+                parser.read_file(f)
+        except FileNotFoundError:
+            logger.info(f"Configuration file '{config_file_path}' not found. LLM features may be unavailable.")
+            example_config_path = os.path.join(PACKAGE_ROOT_DIR, "llm_config.ini.example")
+            if os.path.exists(example_config_path):
+                logger.info(f"Configuration file '{config_file_name}' not found.")
+                logger.info(f"To enable LLM features, please copy '{example_config_path}' to '{config_file_path}' and set your API keys in environment variables.")
+                logger.info("See README.md for more details.")
+            else:
+                logger.info(f"Configuration file '{config_file_name}' not found and no example configuration was found.")
+                logger.info("LLM features will be disabled. See README.md for manual configuration instructions if you wish to use them.")
+            return LLMConfig() 
 
     # Default values
     model_name: Optional[str] = None
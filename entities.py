@@ -11,6 +11,9 @@ class GameEntity:
     Entities define the visual representation, basic properties (like walkability),
     and potential interactions for objects placed on the map.
     """
+    # Slotted like Tile; subclasses without their own __slots__ (e.g. NPC) still get a __dict__
+    __slots__ = ("name", "char", "color", "walkable", "interactive", "buildable", "description", "is_mycelial")
+
     def __init__(self, name: str, char: str, color: int, walkable: bool, interactive: bool, buildable: bool, description: str = "", is_mycelial: bool = False):
         """Initializes a GameEntity.
 
@@ -33,12 +36,29 @@ class GameEntity:
         self.description = description
         self.is_mycelial = is_mycelial # NEW: Flag for mycelial network entities
 
+    def on_tile_interact(self, game_state: 'GameState', tile: 'Tile'):
+        """Handles the player interacting with the tile this entity occupies.
+
+        Called by `Tile.interact`. Subclasses with interaction behaviour override
+        this; the base version only logs a debug message.
+
+        Args:
+            game_state (GameState): The current game state.
+            tile (Tile): The tile the entity is located on.
+        """
+        if self.interactive:
+            game_state.add_debug_message(f"Interacted with {self.name}, but no specific logic handled by Tile.interact.")
+        else:
+            game_state.add_debug_message(f"Nothing to interact with: {self.name}")
+
 class Structure(GameEntity):
     """Represents buildable or pre-placed structures on the map.
 
     Structures are game entities that often have specific interaction logic,
     like workshops, doors, or quest objectives.
     """
+    __slots__ = ("_interaction_logic",)
+
     def __init__(self, name: str, char: str, color: int, walkable: bool, buildable: bool = False, description: str = "",
                  interaction_logic: Callable[['GameState', 'Tile', 'Structure'], None] | None = None, **kwargs):
         """Initializes a Structure.
@@ -62,6 +82,10 @@ class Structure(GameEntity):
         # Store the function reference needed for interaction
         self._interaction_logic = interaction_logic
 
+    def on_tile_interact(self, game_state: 'GameState', tile: 'Tile'):
+        """Interacting with a structure's tile runs its interaction logic."""
+        self.interact(game_state, tile)
+
     def interact(self, game_state: 'GameState', tile: 'Tile'):
         """Performs the player interaction associated with this structure.
 
@@ -83,6 +107,8 @@ class Sublevel(GameEntity):
 
     Interacting with a Sublevel entity typically triggers a map transition.
     """
+    __slots__ = ("_entry_logic",)
+
     def __init__(self, name: str, char: str, color: int, walkable: bool = True, description: str = "",
                  entry_logic: Callable[['GameState', 'Tile', 'Sublevel'], None] | None = None):
         """Initializes a Sublevel entry point.
@@ -103,6 +129,10 @@ class Sublevel(GameEntity):
         # Store the function reference needed for entry
         self._entry_logic = entry_logic
 
+    def on_tile_interact(self, game_state: 'GameState', tile: 'Tile'):
+        """Interacting with a sublevel entry's tile enters the sublevel."""
+        self.enter(game_state, tile)
+
     def enter(self, game_state: 'GameState', tile: 'Tile'):
         """Handles the logic for entering this sub-level via player interaction.
 
@@ -126,6 +156,8 @@ class ResourceNode(GameEntity):
     These entities are typically targeted by dwarf tasks ('mine', 'chop') rather than
     direct player interaction.
     """
+    __slots__ = ("resource_type", "yield_amount", "spore_yield")
+
     def __init__(self, name: str, char: str, color: int, walkable: bool, resource_type: str, yield_amount: int = 1, spore_yield: int = 0, description: str = "", **kwargs):
         """Initializes a ResourceNode.
 
@@ -677,6 +677,8 @@ class GameLogic:
                         )
                         self.game_state.oracle_streaming_active = True
                         self.game_state.oracle_streaming_buffer = ""
+                        # Drop any half-revealed chunk left by an interrupted earlier stream
+                        self.game_state.oracle_streaming_pending_chunk = None
                         self.game_state.oracle_streaming_delay_counter = 0
                         self.game_state.oracle_interaction_state = "STREAMING_RESPONSE"
                         
@@ -877,6 +879,12 @@ class GameLogic:
         while (self.game_state.oracle_streaming_delay_counter <= 0 and 
                time_spent_streaming_this_tick_ms < max_streaming_time_per_tick_ms):
             try:
+                # Finish revealing the current chunk one character per delay before pulling the next action
+                if self.game_state.oracle_streaming_pending_chunk is not None:
+                    self._reveal_pending_stream_character()
+                    time_spent_streaming_this_tick_ms += 10
+                    continue
+
                 streaming_action = next(self.game_state.oracle_streaming_generator)
                 action_type = streaming_action.get("action_type")
                 details = streaming_action.get("details", {})
@@ -940,15 +948,36 @@ class GameLogic:
                 break
 
     def _process_stream_text_chunk(self, details): # Removed max_width, max_height
-        """Process a single streaming text chunk. Modifies oracle_streaming_line_buffer.
-        Commits to oracle_current_dialogue only on newlines or style changes."""
-        text_char = details.get("text", "")
+        """Process a single streaming text chunk.
+
+        The chunk is revealed one character at a time: its first character is
+        applied now and the rest is kept in oracle_streaming_pending_chunk for
+        _reveal_pending_stream_character, so delay_ms stays a per-character delay."""
+        text = details.get("text", "")
         target = details.get("target", "oracle_dialogue")
-        delay_ms = details.get("delay_ms", 0) # Keep delay for pacing
         
-        if target != "oracle_dialogue" or text_char is None:
+        if target != "oracle_dialogue" or text is None:
             return
         
+        if len(text) > 1:
+            self.game_state.oracle_streaming_pending_chunk = (details, 1)
+        self._apply_stream_character(text[:1], details)
+
+    def _reveal_pending_stream_character(self):
+        """Reveal the next character of the pending streaming chunk."""
+        details, index = self.game_state.oracle_streaming_pending_chunk
+        text = details["text"]
+        if index + 1 < len(text):
+            self.game_state.oracle_streaming_pending_chunk = (details, index + 1)
+        else:
+            self.game_state.oracle_streaming_pending_chunk = None
+        self._apply_stream_character(text[index], details)
+
+    def _apply_stream_character(self, text_char, details):
+        """Apply one streamed character. Modifies oracle_streaming_line_buffer.
+        Commits to oracle_current_dialogue only on newlines or style changes."""
+        delay_ms = details.get("delay_ms", 0) # Keep delay for pacing
+        
         current_char_style = self._get_text_style(details.get("text_type"), details)
         current_line_text, current_line_style = self.game_state.oracle_streaming_line_buffer
         
@@ -972,7 +1001,7 @@ class GameLogic:
         # Update the game state's streaming line buffer
         self.game_state.oracle_streaming_line_buffer = (current_line_text, current_line_style)
         
-        # Set delay for this chunk
+        # Set delay for this character
         self.game_state.oracle_streaming_delay_counter = delay_ms
         
         # Auto-scroll logic (based on committed lines only) - can be removed if renderer handles all scrolling
@@ -1007,6 +1036,7 @@ class GameLogic:
         self.game_state.oracle_streaming_buffer = "" 
         self.game_state.oracle_streaming_delay_counter = 0
         self.game_state.oracle_streaming_line_buffer = ("", "NORMAL") # Reset line buffer
+        self.game_state.oracle_streaming_pending_chunk = None
 
     def _update_dwarf(self, dwarf):
         # Log if state changed or if dwarf is active
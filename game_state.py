@@ -1,5 +1,6 @@
 # game_state.py
 import random
+import copy
 from typing import List, Dict, Tuple, Optional, Any, TypedDict, TYPE_CHECKING
 import logging # Import logging
 import os # Import os for path manipulation
@@ -34,6 +35,14 @@ logger = logging.getLogger(__name__) # Get logger instance
 
 MapGrid = List[List[Tile]]
 
+# Buildable structures: Name -> {requirements, ticks}
+# Requirements: {'resources': {res_name: qty}, 'special_items': {item_name: qty}}
+# Ticks: Time cost for a dwarf to build it.
+BUILDING_DEFINITIONS: Dict[str, Dict] = {
+    "Mycelial Nexus": {"resources": {"wood": 10, "fungi": 5}, "special_items": {"Sclerotium": 1}, "ticks": 20},
+    "Dwarven Sporeforge": {"resources": {"stone": 15, "wood": 5}, "special_items": {}, "ticks": 15}
+}
+
 # --- Event Structure Definition ---
 class GameEvent(TypedDict):
     type: str         # e.g., "interaction", "combat", "mission_update", "dwarf_task_complete"
@@ -117,6 +126,7 @@ class GameState:
         oracle_streaming_buffer (str): Buffer for OLD enhanced Oracle streaming (can be removed if new line buffer works)
         oracle_streaming_line_buffer (Tuple[str, str]): Buffer for the current line being streamed char-by-char
         oracle_streaming_delay_counter (int): Counter for enhanced Oracle streaming delay
+        oracle_streaming_pending_chunk (Optional[Tuple[Dict[str, Any], int]]): Streamed chunk still being revealed and the index of its next character
         active_pulses (List[ActivePulse]): For mycelial network pulse effects
     """
     def __init__(self, llm_config: LLMConfig) -> None:
@@ -180,6 +190,8 @@ class GameState:
         # Stores (current_text_chars, current_style_tag string)
         self.oracle_streaming_line_buffer: Tuple[str, str] = ("", "NORMAL") 
         self.oracle_streaming_delay_counter: int = 0
+        # Stores (chunk_details, next_char_index) while a multi-character chunk is revealed char-by-char
+        self.oracle_streaming_pending_chunk: Optional[Tuple[Dict[str, Any], int]] = None
 
         # --- Oracle Content Generation Tracking ---
         self.oracle_generated_content: List[Dict[str, Any]] = []  # Track content generated by oracle interactions
@@ -233,13 +245,8 @@ class GameState:
         }
         self.task_manager = TaskManager()
 
-        # Define buildable structures: Name -> {requirements, ticks}
-        # Requirements: {'resources': {res_name: qty}, 'special_items': {item_name: qty}}
-        # Ticks: Time cost for a dwarf to build it.
-        self.buildings: Dict[str, Dict] = {
-            "Mycelial Nexus": {"resources": {"wood": 10, "fungi": 5}, "special_items": {"Sclerotium": 1}, "ticks": 20},
-            "Dwarven Sporeforge": {"resources": {"stone": 15, "wood": 5}, "special_items": {}, "ticks": 15}
-        }
+        # Define buildable structures (copied so per-game tweaks never touch the shared definitions)
+        self.buildings: Dict[str, Dict] = copy.deepcopy(BUILDING_DEFINITIONS)
 
         # --- Initialize Event Queue ---
         self.event_queue = []
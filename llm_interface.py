@@ -17,6 +17,8 @@ import time # Added for retry delays
 from pathlib import Path # Added for file management
 import sys # Added for fallback print in _log_oracle_interaction
 import logging # MODIFIED: Import logging
+import importlib.util
+from functools import lru_cache
 
 # Import the new text streaming engine
 from fungi_fortress.text_streaming import text_streaming_engine
@@ -25,27 +27,11 @@ from fungi_fortress.config_manager import detect_provider_from_model # ADDED THI
 # Get a logger instance for this module
 logger = logging.getLogger(__name__) # NEW: Define logger for this module
 
-# Support for multiple LLM providers
-try:
-    from groq import Groq, RateLimitError, APIConnectionError, APIStatusError
-    GROQ_AVAILABLE = True
-except ImportError:
-    GROQ_AVAILABLE = False
-    RateLimitError = Exception
-    APIConnectionError = Exception
-    APIStatusError = Exception
-
-try:
-    import openai
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-
-try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
+# Support for multiple LLM providers.
+# The SDKs take most of a second to import, so only check they are installed
+# here; each API function imports its SDK when a call is actually made.
+GROQ_AVAILABLE = importlib.util.find_spec("groq") is not None
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
 
 # Import GameEvent and GameState if defined elsewhere for type hinting
 # from .game_state import GameEvent, GameState # Assuming GameEvent is defined there
@@ -90,6 +76,7 @@ def _call_xai_api_streaming(prompt: str, api_key: str, model_name: str, max_toke
         _log_debug_message("XAI API", "OPENAI_AVAILABLE is False, yielding error.")
         yield "Error: openai library required for XAI API calls"
         return
+    import openai
     _log_debug_message("XAI API", "OPENAI_AVAILABLE is True, proceeding.")
     
     try:
@@ -177,6 +164,7 @@ def _call_openai_compatible_api_streaming(prompt: str, api_key: str, model_name:
     if not OPENAI_AVAILABLE:
         yield "Error: openai library not available for API calls."
         return
+    import openai
         
     try:
         client = openai.OpenAI(
@@ -225,6 +213,7 @@ def _call_groq_api_streaming(prompt: str, api_key: str, model_name: str, max_tok
     if not GROQ_AVAILABLE:
         yield "Error: Groq library not available."
         return
+    from groq import Groq, RateLimitError, APIConnectionError, APIStatusError
         
     try:
         client = Groq(api_key=api_key, timeout=timeout_seconds)
@@ -251,6 +240,39 @@ def _call_groq_api_streaming(prompt: str, api_key: str, model_name: str, max_tok
     except Exception as e:
         yield f"Groq API Error: {str(e)}"
 
+# Structured output schema for XAI Oracle replies; built once rather than per call
+_ORACLE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "oracle_response",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "narrative": {
+                    "type": "string",
+                    "description": "The Oracle's narrative response to show to the player"
+                },
+                "actions": {
+                    "type": "array",
+                    "description": "Game actions to execute",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "action_type": {"type": "string"},
+                            "details": {"type": "object"}
+                        },
+                        "required": ["action_type", "details"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["narrative", "actions"],
+            "additionalProperties": False
+        }
+    }
+}
+
 def _call_xai_api(prompt: str, api_key: str, model_name: str, max_tokens: int = 500, timeout_seconds: int = 30, use_structured_output: bool = True) -> Optional[str]:
     """Makes an API call to XAI using the OpenAI SDK with XAI-specific parameters.
     
@@ -267,6 +289,7 @@ def _call_xai_api(prompt: str, api_key: str, model_name: str, max_tokens: int =
     """
     if not OPENAI_AVAILABLE:
         return "Error: openai library required for XAI API calls"
+    import openai
     
     try:
         # Create XAI client using OpenAI SDK
@@ -306,38 +329,7 @@ def _call_xai_api(prompt: str, api_key: str, model_name: str, max_tokens: int =
         
         # Add structured output schema if enabled
         if use_structured_output:
-            oracle_schema = {
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "oracle_response",
-                    "strict": True,
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "narrative": {
-                                "type": "string",
-                                "description": "The Oracle's narrative response to show to the player"
-                            },
-                            "actions": {
-                                "type": "array",
-                                "description": "Game actions to execute",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "action_type": {"type": "string"},
-                                        "details": {"type": "object"}
-                                    },
-                                    "required": ["action_type", "details"],
-                                    "additionalProperties": False
-                                }
-                            }
-                        },
-                        "required": ["narrative", "actions"],
-                        "additionalProperties": False
-                    }
-                }
-            }
-            completion_params["response_format"] = oracle_schema
+            completion_params["response_format"] = _ORACLE_RESPONSE_FORMAT
         
         # Make the API call
         _log_debug_message("XAI API", f"Making request to model: {model_name}")
@@ -370,15 +362,15 @@ def _call_xai_api(prompt: str, api_key: str, model_name: str, max_tokens: int =
         
         return content
         
-    except RateLimitError as e:
+    except openai.RateLimitError as e:
         error_msg = f"Rate limit exceeded: {e}"
         _log_debug_message("XAI API", error_msg)
         return f"Error: {error_msg}"
-    except APIConnectionError as e:
+    except openai.APIConnectionError as e:
         error_msg = f"Connection error: {e}"
         _log_debug_message("XAI API", error_msg)
         return f"Error: {error_msg}"
-    except APIStatusError as e:
+    except openai.APIStatusError as e:
         error_msg = f"API status error: {e}"
         _log_debug_message("XAI API", error_msg)
         return f"Error: {error_msg}"
@@ -402,6 +394,7 @@ def _call_openai_compatible_api(prompt: str, api_key: str, model_name: str, base
     """
     if not OPENAI_AVAILABLE:
         return "Error: openai library not available for API calls."
+    import openai
         
     try:
         client = openai.OpenAI(
@@ -444,6 +437,7 @@ def _call_groq_api(prompt: str, api_key: str, model_name: str, max_tokens: int =
     """
     if not GROQ_AVAILABLE:
         return "Error: Groq library not available."
+    from groq import Groq, RateLimitError
         
     try:
         client = Groq(api_key=api_key, timeout=timeout_seconds)
@@ -929,8 +923,35 @@ def _call_with_retries(api_func, *args, max_retries: int = 2, retry_delay: float
     
     return f"API Error after {max_retries + 1} attempts: {last_error}" 
 
+@lru_cache(maxsize=64)
+def _resolve_provider(model_name: str, provider_hint: Optional[str]) -> str:
+    """Resolves which provider serves a model for `_detect_provider_and_call_api`.
+
+    An explicit hint other than "auto" wins; otherwise the provider is
+    inferred from the model name's prefix, defaulting to "openai". Cached,
+    since a game keeps asking about the same configured model.
+
+    Args:
+        model_name (str): The model to route.
+        provider_hint (Optional[str]): Provider named in the config, if any.
+
+    Returns:
+        str: The lowercase provider name.
+    """
+    if provider_hint and provider_hint.lower() != "auto":
+        return provider_hint.lower()
+    if model_name.startswith(("grok", "grok-")):
+        return "xai"
+    if model_name.startswith(("gpt-", "text-", "davinci", "curie", "babbage", "ada")):
+        return "openai"
+    if model_name.startswith(("claude-", "claude")):
+        return "anthropic"
+    if model_name.startswith(("llama", "mixtral", "gemma")):
+        return "groq"
+    return "openai"
+
 def _detect_provider_and_call_api(prompt: str, api_key: str, model_name: str, provider_hint: str = None, 
-                                  llm_config = None) -> Optional[str]:
+                                  llm_config = None, *, dry_run: bool = False) -> Optional[str]:
     """Detects the provider based on model name and makes appropriate API call with safety features.
     
     Args:
@@ -939,15 +960,24 @@ def _detect_provider_and_call_api(prompt: str, api_key: str, model_name: str, pr
         model_name (str): The specific model to use.
         provider_hint (str): Optional hint about which provider to use.
         llm_config: LLM configuration object with safety settings.
+        dry_run (bool): If True, return the detected provider name instead of
+                        calling its API. Used to check routing without network access.
         
     Returns:
         Optional[str]: The LLM's response string, or None if an error occurs.
+                       With `dry_run`, the provider name (e.g. "xai").
     """
     _log_debug_message("LLM API Call", f"Sending prompt (first 100 chars): {prompt[:100]}...")
     _log_debug_message("LLM API Call", f"Using API Key: {'*' * (len(api_key) - 4) + api_key[-4:] if api_key and len(api_key) > 4 else 'KEY_TOO_SHORT_OR_INVALID'}")
     _log_debug_message("LLM API Call", f"Using Model: {model_name}")
     _log_debug_message("LLM API Call", f"Provider Hint: {provider_hint}")
 
+    # Routing only depends on the model name and hint, so a dry run needs no usable key
+    if dry_run:
+        provider = _resolve_provider(model_name or "", provider_hint)
+        _log_debug_message("LLM API Call", f"Detected provider (dry run): {provider}")
+        return provider
+
     if not api_key or api_key == "YOUR_API_KEY_HERE" or api_key == "testkey123":
         error_msg = "Error: API key is missing, a placeholder, or the test key. Configure llm_config.ini."
         _log_debug_message("LLM API Call", error_msg)
@@ -973,18 +1003,7 @@ def _detect_provider_and_call_api(prompt: str, api_key: str, model_name: str, pr
     _log_debug_message("LLM API Call", f"Safety limits: max_tokens={max_tokens}, timeout={timeout_seconds}s, retries={max_retries}")
 
     # Determine provider based on model name or hint
-    if provider_hint and provider_hint.lower() != "auto":
-        provider = provider_hint.lower()
-    elif model_name.startswith(("grok", "grok-")):
-        provider = "xai"
-    elif model_name.startswith(("gpt-", "text-", "davinci", "curie", "babbage", "ada")):
-        provider = "openai"
-    elif model_name.startswith(("claude-", "claude")):
-        provider = "anthropic"
-    elif model_name.startswith(("llama", "mixtral", "gemma")):
-        provider = "groq"
-    else:
-        provider = "openai"
+    provider = _resolve_provider(model_name, provider_hint)
     
     _log_debug_message("LLM API Call", f"Detected provider: {provider}")
     
@@ -9,6 +9,14 @@ if TYPE_CHECKING:
     from .characters import Oracle # For type hinting
     from .game_state import GameState # For type hinting, if needed later
 
+# Error dialogue, kept as tuples so the text is shared; callers get a fresh list
+# each time because the dialogue UI appends to whatever list it is given.
+_SILENT_RESPONSE = ("The Oracle remains eerily silent.", "(Error: Oracle has no responses defined)")
+_JUMBLED_LINE = "The Oracle's words are jumbled."
+_JUMBLED_ERROR_FMT = "(Error: Malformed dialogue for trigger '{}')"
+_NO_ANSWER_LINE = "The Oracle offers no clear answer at this moment."
+_NO_ANSWER_ERROR_FMT = "(Error: Trigger '{}' not found and no fallback_error defined in Oracle responses)"
+
 def get_canned_response(oracle: 'Oracle', trigger: str = "default_query_response") -> List[str]:
     """Retrieves a canned response from the Oracle based on a trigger.
 
@@ -22,7 +30,7 @@ def get_canned_response(oracle: 'Oracle', trigger: str = "default_query_response
                    specified trigger is not found or if the Oracle has no canned responses.
     """
     if not oracle or not hasattr(oracle, 'canned_responses') or not oracle.canned_responses:
-        return ["The Oracle remains eerily silent.", "(Error: Oracle has no responses defined)"]
+        return list(_SILENT_RESPONSE)
 
     # Check if the trigger exists directly in the canned_responses dictionary
     dialogue_lines = oracle.canned_responses.get(trigger)
@@ -34,7 +42,7 @@ def get_canned_response(oracle: 'Oracle', trigger: str = "default_query_response
             return [dialogue_lines]
         else:
             # This case should ideally not happen if data is structured correctly
-            return [f"The Oracle's words are jumbled.", f"(Error: Malformed dialogue for trigger '{trigger}')"]
+            return [_JUMBLED_LINE, _JUMBLED_ERROR_FMT.format(trigger)]
     
     # Fallback if the specific trigger isn't found
     fallback_dialogue = oracle.canned_responses.get("fallback_error")
@@ -44,7 +52,7 @@ def get_canned_response(oracle: 'Oracle', trigger: str = "default_query_response
         elif isinstance(fallback_dialogue, str):
             return [fallback_dialogue]
             
-    return ["The Oracle offers no clear answer at this moment.", f"(Error: Trigger '{trigger}' not found and no fallback_error defined in Oracle responses)"]
+    return [_NO_ANSWER_LINE, _NO_ANSWER_ERROR_FMT.format(trigger)]
 
 # Example usage (can be run if characters.py and this file are in the same dir for simple testing)
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 # player.py
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, FrozenSet
 
 # Revert constants import to relative
 try:
@@ -35,6 +35,13 @@ class Player:
         max_carry_weight (int): The maximum weight of resources the player can carry between levels.
         state (Dict[str, Any]): A dictionary for storing any additional, less common player state variables.
     """
+    # Slotted like the map entities; the direct attributes plus the `state` fallback dict
+    __slots__ = ('location', 'completed_quests', 'spore_exposure',
+                 'spells', 'max_carry_weight', 'spell_slots', 'state')
+
+    # Stats stored as direct attributes; everything else goes to `self.state`
+    _DIRECT_ATTRS: FrozenSet[str] = frozenset(__slots__) - {'state'}
+
     def __init__(self, starting_stats: Dict[str, Any] = STARTING_PLAYER_STATS):
         """Initializes the player state from a dictionary of starting stats.
 
@@ -54,8 +61,9 @@ class Player:
         self.location: str = starting_stats.get('location', "Unknown")
         self.completed_quests: List[str] = starting_stats.get('completed_quests', [])
         self.spore_exposure: int = starting_stats.get('spore_exposure', 0)
-        self.spells: List[str] = starting_stats.get('spells', [])
-        self.spell_slots: List[Optional[str]] = starting_stats.get('spell_slots', [None] * MAX_SPELL_SLOTS)
+        # Copied so learning spells or assigning slots never writes through to the shared starting stats
+        self.spells: List[str] = list(starting_stats.get('spells', []))
+        self.spell_slots: List[Optional[str]] = list(starting_stats.get('spell_slots', [None] * MAX_SPELL_SLOTS))
         self.max_carry_weight: int = starting_stats.get('max_carry_weight', 10)
 
         # Initialize spell slots with starting spells
@@ -64,8 +72,7 @@ class Player:
 
         # If we need to store other misc state, we can keep the dict for that
         self.state: Dict[str, Any] = {k: v for k, v in starting_stats.items() 
-                                    if k not in ['location', 'completed_quests', 'spore_exposure', 
-                                               'spells', 'max_carry_weight', 'spell_slots']}
+                                    if k not in Player._DIRECT_ATTRS}
 
         # Ensure essential keys exist, even if not in starting_stats (Less needed now)
         # self.state.setdefault('location', "Unknown")
@@ -81,16 +88,17 @@ class Player:
     def update_state(self, key: str, value: Any):
         """Updates a specific player attribute or state variable.
 
-        Checks if the `key` corresponds to a direct attribute (like `location` or
-        `spore_exposure`) and updates it. Otherwise, updates the value in the
-        fallback `self.state` dictionary.
+        Checks if the `key` is one of the direct attributes in `_DIRECT_ATTRS`
+        (like `location` or `spore_exposure`) and updates it. Otherwise, updates
+        the value in the fallback `self.state` dictionary.
 
         Args:
             key (str): The name of the attribute or state variable to update.
             value: The new value to assign.
         """
-        # Check if it's a direct attribute first
-        if hasattr(self, key):
+        # Check if it's a direct attribute first (a set lookup, unlike hasattr,
+        # which would also match methods)
+        if key in Player._DIRECT_ATTRS:
             setattr(self, key, value)
         else:
             # Fallback to the state dictionary for other values
@@ -461,6 +461,42 @@ def test_surface_mycelium_does_not_convert_ineligible_tiles(mock_game_state, moc
 
     assert mock_game_state.map[0][0].entity == wall, "Wall tile should not be converted"
 
+# --- Tests for _process_stream_text_chunk ---
+
+def _start_stream(game_state, actions):
+    """Points the mocked game state at a fresh streaming generator over `actions`."""
+    game_state.oracle_streaming_active = True
+    game_state.oracle_streaming_generator = iter(actions)
+    game_state.oracle_streaming_delay_counter = 0
+    game_state.oracle_streaming_pending_chunk = None
+    game_state.oracle_streaming_line_buffer = ("", "NORMAL")
+    game_state.oracle_current_dialogue = []
+
+def test_stream_chunk_reveals_one_character_per_tick(game_logic_instance):
+    """A multi-character chunk keeps the typewriter cadence of one character per tick."""
+    game_state = game_logic_instance.game_state
+    text = "The Oracle speaks"
+    _start_stream(game_state, [{"action_type": "stream_text_chunk",
+                                "details": {"text": text, "text_type": "oracle_dialogue", "delay_ms": 30}}])
+
+    for tick in range(1, len(text) + 1):
+        game_logic_instance._process_oracle_streaming()
+        assert game_state.oracle_streaming_line_buffer == (text[:tick], "NORMAL")
+    assert game_state.oracle_streaming_pending_chunk is None
+
+def test_stream_chunk_commits_embedded_newlines(game_logic_instance):
+    """A newline inside a chunk commits the buffered line when it is revealed."""
+    game_state = game_logic_instance.game_state
+    text = "Oracle\nspeaks"
+    _start_stream(game_state, [{"action_type": "stream_text_chunk",
+                                "details": {"text": text, "text_type": "oracle_dialogue", "delay_ms": 30}}])
+
+    for _ in text:
+        game_logic_instance._process_oracle_streaming()
+
+    assert game_state.oracle_current_dialogue == [("Oracle", "NORMAL")]
+    assert game_state.oracle_streaming_line_buffer == ("speaks", "NORMAL")
+
 # --- Tests for _trigger_sublevel_entry ---
 
 # Patch the generation functions within the fungi_fortress.game_logic module
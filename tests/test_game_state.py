@@ -1,11 +1,20 @@
 import pytest
 from fungi_fortress.game_state import GameState # Assuming GameState is the main class
+from fungi_fortress.config_manager import LLMConfig
 
 # TODO: Add necessary imports and fixtures
 
 def test_example_game_state_functionality():
-    # TODO: Replace with actual tests for GameState
+    """TODO: Replace with actual tests for GameState."""
     # Example:
     # state = GameState() # May need initialization parameters
     # assert state.some_property == expected_value
-    assert True 
\ No newline at end of file
+    assert True 
+def test_bare_game_state_matches_init_attributes(bare_game_state):
+    """conftest's `_bare_game_state` must set exactly the attributes `GameState.__init__` does."""
+    llm_config = LLMConfig(api_key="test_key")
+    real_attrs = set(vars(GameState(llm_config)))
+    bare_attrs = set(vars(bare_game_state(llm_config)))
+
+    assert real_attrs - bare_attrs == set(), "Attributes missing from _bare_game_state"
+    assert bare_attrs - real_attrs == set(), "Attributes _bare_game_state sets but GameState.__init__ does not"
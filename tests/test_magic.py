@@ -1,31 +1,36 @@
 import pytest
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import MagicMock
 import random
+from dataclasses import dataclass
+from types import SimpleNamespace
 
 # Import necessary components from magic.py
 from fungi_fortress.magic import fungal_bloom_effect, SpellDefinition, ENTITY_REGISTRY as MAGIC_ENTITY_REGISTRY
 from fungi_fortress.tiles import Tile, GameEntity # Tile needed for type hints and creation
-# GameState, Dwarf, Animal, NPC needed for type hints and mock creation
-from fungi_fortress.game_state import GameState
+# Dwarf, Animal, NPC needed for type hints and mock creation
 from fungi_fortress.characters import Dwarf, Animal, NPC
+from fungi_fortress.constants import MAP_WIDTH, MAP_HEIGHT
 
 # --- Mock Entities ---
 
-@pytest.fixture
+@dataclass(frozen=True, slots=True)
+class _MockEntity:
+    """Immutable stand-in for GameEntity; only name/walkable are read by the effects."""
+    name: str
+    walkable: bool
+
+# (name, walkable) for every entity the magic effects look up; add others if needed
+MOCK_ENTITY_SPECS = (
+    ("fungi", True), ("magic_fungi", True), ("grass", True),
+    ("stone_floor", True), ("mycelium_floor", True),
+    ("water", False), ("stone_wall", False), ("tree", False),
+)
+
+@pytest.fixture(scope="session")
 def mock_entities():
     """Provides mock GameEntity objects for testing."""
-    entities = {}
-    for name, walkable in [
-        ("fungi", True), ("magic_fungi", True), ("grass", True),
-        ("stone_floor", True), ("mycelium_floor", True),
-        ("water", False), ("stone_wall", False), ("tree", False) # Add other entities if needed
-    ]:
-        # Create mock without spec, but ensure required attributes exist
-        mock_entity = MagicMock()
-        mock_entity.name = name
-        mock_entity.walkable = walkable
-        entities[name] = mock_entity
-    return entities
+    # Immutable, so one set can safely be shared by the whole session
+    return {name: _MockEntity(name, walkable) for name, walkable in MOCK_ENTITY_SPECS}
 
 @pytest.fixture
 def mock_entity_registry(monkeypatch, mock_entities):
@@ -35,271 +40,186 @@ def mock_entity_registry(monkeypatch, mock_entities):
     # This replaces the original dict with our mock dict for the test duration
     return mock_entities
 
-
-# --- Mock GameState ---
-
-@pytest.fixture
-def mock_tile():
-    """Creates a single mock Tile."""
-    tile = MagicMock(spec=Tile)
-    tile.x = 5
-    tile.y = 5
-    tile.entity = None # Start with no entity
-    tile.walkable = True # Assume walkable unless entity makes it not
-    tile.pulse_ticks = 0
-    tile.set_color_override = MagicMock()
-    # Add other attributes if needed by effects
-    return tile
-
 @pytest.fixture
-def mock_game_state(mock_entity_registry): # Depends on registry fixture
-    """Creates a mock GameState object configured for magic tests."""
-    game = MagicMock(spec=GameState)
-
-    # Map setup
-    game.map = {} # Use a dict for sparse map representation in tests {(x, y): Tile}
-    def _get_tile(x, y):
-        return game.map.get((x, y))
-    game.get_tile = MagicMock(side_effect=_get_tile)
-
-    # Debugging
-    game.add_debug_message = MagicMock()
-
-    # Mycelial Network related attributes
-    game.mycelial_network = {} # {(x, y): [(nx, ny), ...]}
-    game.nexus_site = None # (x, y) or None
-    game.network_distances = {} # {(x, y): distance}
-    game.calculate_network_distances = MagicMock(return_value={}) # Mock the calculation
-
-    # Other relevant attributes
-    game.magic_fungi_locations = []
-    game.dwarves = []
-    game.animals = []
-    game.characters = [] # For NPCs
-
-    # Player (if needed by specific effects)
-    game.player = MagicMock()
-
-    return game
-
-
-# --- Tests for fungal_bloom_effect ---
-
-def test_fungal_bloom_converts_grass_to_fungi(mock_game_state, mock_entity_registry, mock_tile):
-    """Test grass converts to fungi with favorable random chance."""
-    grass = mock_entity_registry["grass"]
-    fungi = mock_entity_registry["fungi"]
-    mock_tile.entity = grass
-    mock_game_state.map[(mock_tile.x, mock_tile.y)] = mock_tile
-
-    # Ensure random check passes (random.random() < 0.3)
-    with patch('random.random', return_value=0.1):
-        fungal_bloom_effect(mock_tile, mock_game_state)
-
-    assert mock_tile.entity == fungi
-    mock_game_state.add_debug_message.assert_called_with(f"Fungal Bloom: Created fungi at ({mock_tile.x}, {mock_tile.y})")
-
-def test_fungal_bloom_converts_stone_floor_to_fungi(mock_game_state, mock_entity_registry, mock_tile):
-    """Test stone floor converts to fungi with favorable random chance."""
-    stone_floor = mock_entity_registry["stone_floor"]
-    fungi = mock_entity_registry["fungi"]
-    mock_tile.entity = stone_floor
-    mock_game_state.map[(mock_tile.x, mock_tile.y)] = mock_tile
-
-    with patch('random.random', return_value=0.1):
-        fungal_bloom_effect(mock_tile, mock_game_state)
-
-    assert mock_tile.entity == fungi
-
-def test_fungal_bloom_does_not_convert_grass_if_random_fails(mock_game_state, mock_entity_registry, mock_tile):
-    """Test grass does not convert if random check fails."""
-    grass = mock_entity_registry["grass"]
-    mock_tile.entity = grass
-    mock_game_state.map[(mock_tile.x, mock_tile.y)] = mock_tile
-
-    # Ensure random check fails (random.random() >= 0.3)
-    with patch('random.random', return_value=0.5):
-        fungal_bloom_effect(mock_tile, mock_game_state)
-
-    assert mock_tile.entity == grass # Should remain grass
-    mock_game_state.add_debug_message.assert_not_called()
-
-
-# --- Fungi to Magic Fungi Conversion Tests ---
-
-def test_fungal_bloom_converts_fungi_with_base_chance(mock_game_state, mock_entity_registry, mock_tile):
-    """Test fungi converts with base probability (10%) when no water/tree is nearby."""
-    fungi = mock_entity_registry["fungi"]
-    magic_fungi = mock_entity_registry["magic_fungi"]
-    mock_tile.entity = fungi
-    mock_game_state.map[(mock_tile.x, mock_tile.y)] = mock_tile
-
-    # Ensure random check passes for base probability (random.random() < 0.10)
-    with patch('random.random', return_value=0.05):
-        fungal_bloom_effect(mock_tile, mock_game_state)
-
-    assert mock_tile.entity == magic_fungi
-    assert (mock_tile.x, mock_tile.y) in mock_game_state.magic_fungi_locations
-    mock_game_state.add_debug_message.assert_called_with(f"Fungal Bloom: Converted fungi to magic fungi at ({mock_tile.x}, {mock_tile.y}) with prob 0.10")
+def ents(mock_entity_registry):
+    """Exposes the patched registry entries as attributes (e.g. `ents.grass`)."""
+    return SimpleNamespace(**mock_entity_registry)
 
-def test_fungal_bloom_does_not_convert_fungi_with_base_chance_if_random_fails(mock_game_state, mock_entity_registry, mock_tile):
-    """Test fungi does not convert with base probability if random check fails."""
-    fungi = mock_entity_registry["fungi"]
-    mock_tile.entity = fungi
-    mock_game_state.map[(mock_tile.x, mock_tile.y)] = mock_tile
 
-    # Ensure random check fails for base probability (random.random() >= 0.10)
-    with patch('random.random', return_value=0.15):
-        fungal_bloom_effect(mock_tile, mock_game_state)
-
-    assert mock_tile.entity == fungi # Should remain normal fungi
-
-
-def test_fungal_bloom_converts_fungi_to_magic_fungi_near_water(mock_game_state, mock_entity_registry, mock_tile):
-    """Test fungi converts to magic fungi near water (10% + 30% = 40% chance)."""
-    fungi = mock_entity_registry["fungi"]
-    magic_fungi = mock_entity_registry["magic_fungi"]
-    water = mock_entity_registry["water"]
-
-    mock_tile.entity = fungi
-    mock_game_state.map[(mock_tile.x, mock_tile.y)] = mock_tile
-
-    # Place water nearby (within 2 tiles)
-    water_tile = MagicMock(spec=Tile, entity=water, x=mock_tile.x + 1, y=mock_tile.y)
-    mock_game_state.map[(water_tile.x, water_tile.y)] = water_tile
-
-    # Ensure random check passes (random.random() < 0.40)
-    with patch('random.random', return_value=0.35):
-        fungal_bloom_effect(mock_tile, mock_game_state)
-
-    assert mock_tile.entity == magic_fungi
-    assert (mock_tile.x, mock_tile.y) in mock_game_state.magic_fungi_locations
-    mock_game_state.add_debug_message.assert_called_with(f"Fungal Bloom: Converted fungi to magic fungi at ({mock_tile.x}, {mock_tile.y}) with prob 0.40")
-
-def test_fungal_bloom_does_not_convert_fungi_near_water_if_random_fails(mock_game_state, mock_entity_registry, mock_tile):
-    """Test fungi does not convert near water if random check fails (>= 0.40)."""
-    fungi = mock_entity_registry["fungi"]
-    water = mock_entity_registry["water"]
-
-    mock_tile.entity = fungi
-    mock_game_state.map[(mock_tile.x, mock_tile.y)] = mock_tile
-
-    # Place water nearby
-    water_tile = MagicMock(spec=Tile, entity=water, x=mock_tile.x + 1, y=mock_tile.y)
-    mock_game_state.map[(water_tile.x, water_tile.y)] = water_tile
-
-    # Ensure random check fails (random.random() >= 0.40)
-    with patch('random.random', return_value=0.45):
-        fungal_bloom_effect(mock_tile, mock_game_state)
-
-    assert mock_tile.entity == fungi # Should remain normal fungi
-
-
-def test_fungal_bloom_converts_fungi_to_magic_fungi_near_tree(mock_game_state, mock_entity_registry, mock_tile):
-    """Test fungi converts to magic fungi near a tree (10% + 20% = 30% chance)."""
-    fungi = mock_entity_registry["fungi"]
-    magic_fungi = mock_entity_registry["magic_fungi"]
-    tree = mock_entity_registry["tree"]
-
-    mock_tile.entity = fungi
-    mock_game_state.map[(mock_tile.x, mock_tile.y)] = mock_tile
-
-    # Place tree nearby
-    tree_tile = MagicMock(spec=Tile, entity=tree, x=mock_tile.x + 1, y=mock_tile.y)
-    mock_game_state.map[(tree_tile.x, tree_tile.y)] = tree_tile
-
-    # Ensure random check passes (random.random() < 0.30)
-    with patch('random.random', return_value=0.25):
-        fungal_bloom_effect(mock_tile, mock_game_state)
-
-    assert mock_tile.entity == magic_fungi
-    assert (mock_tile.x, mock_tile.y) in mock_game_state.magic_fungi_locations
-    mock_game_state.add_debug_message.assert_called_with(f"Fungal Bloom: Converted fungi to magic fungi at ({mock_tile.x}, {mock_tile.y}) with prob 0.30")
-
-
-def test_fungal_bloom_does_not_convert_fungi_near_tree_if_random_fails(mock_game_state, mock_entity_registry, mock_tile):
-    """Test fungi does not convert near tree if random check fails (>= 0.30)."""
-    fungi = mock_entity_registry["fungi"]
-    tree = mock_entity_registry["tree"]
-
-    mock_tile.entity = fungi
-    mock_game_state.map[(mock_tile.x, mock_tile.y)] = mock_tile
-
-    # Place tree nearby
-    tree_tile = MagicMock(spec=Tile, entity=tree, x=mock_tile.x + 1, y=mock_tile.y)
-    mock_game_state.map[(tree_tile.x, tree_tile.y)] = tree_tile
-
-    # Ensure random check fails (random.random() >= 0.30)
-    with patch('random.random', return_value=0.35):
-        fungal_bloom_effect(mock_tile, mock_game_state)
-
-    assert mock_tile.entity == fungi # Should remain normal fungi
+@pytest.fixture
+def roll(request, monkeypatch):
+    """Pins `random.random()` as seen by the magic module to the parametrized value.
 
+    Use with `indirect=["roll"]`; the patch is undone by monkeypatch's finalizer.
+    """
+    monkeypatch.setattr('fungi_fortress.magic.random.random', lambda: request.param)
+    return request.param
 
-def test_fungal_bloom_converts_fungi_to_magic_fungi_near_water_and_tree(mock_game_state, mock_entity_registry, mock_tile):
-    """Test fungi converts near water AND tree (10% + 30% + 20% = 60% chance)."""
-    fungi = mock_entity_registry["fungi"]
-    magic_fungi = mock_entity_registry["magic_fungi"]
-    water = mock_entity_registry["water"]
-    tree = mock_entity_registry["tree"]
 
-    mock_tile.entity = fungi
-    mock_game_state.map[(mock_tile.x, mock_tile.y)] = mock_tile
+# --- Mock GameState ---
 
-    # Place water and tree nearby
-    water_tile = MagicMock(spec=Tile, entity=water, x=mock_tile.x + 1, y=mock_tile.y)
-    mock_game_state.map[(water_tile.x, water_tile.y)] = water_tile
-    tree_tile = MagicMock(spec=Tile, entity=tree, x=mock_tile.x - 1, y=mock_tile.y) # Different location
-    mock_game_state.map[(tree_tile.x, tree_tile.y)] = tree_tile
+class FakeTile:
+    """Slotted stand-in for Tile with only the attributes the effects touch.
 
-    # Ensure random check passes (random.random() < 0.60)
-    with patch('random.random', return_value=0.55):
-        fungal_bloom_effect(mock_tile, mock_game_state)
+    Avoids `MagicMock(spec=Tile)`, whose spec introspection dominates setup cost.
+    """
+    __slots__ = ("x", "y", "entity", "walkable", "pulse_ticks", "set_color_override")
 
-    assert mock_tile.entity == magic_fungi
-    assert (mock_tile.x, mock_tile.y) in mock_game_state.magic_fungi_locations
-    mock_game_state.add_debug_message.assert_called_with(f"Fungal Bloom: Converted fungi to magic fungi at ({mock_tile.x}, {mock_tile.y}) with prob 0.60")
+    def __init__(self, x, y, entity=None, walkable=True, pulse_ticks=0):
+        self.x = x
+        self.y = y
+        self.entity = entity
+        self.walkable = walkable
+        self.pulse_ticks = pulse_ticks
+        self.set_color_override = MagicMock()
 
+@pytest.fixture(scope="session")
+def tile_factory():
+    """Returns a factory for lightweight tile stand-ins."""
+    return FakeTile
 
-def test_fungal_bloom_does_not_convert_fungi_near_water_and_tree_if_random_fails(mock_game_state, mock_entity_registry, mock_tile):
-    """Test fungi does not convert near water and tree if random fails (>= 0.60)."""
-    fungi = mock_entity_registry["fungi"]
-    water = mock_entity_registry["water"]
-    tree = mock_entity_registry["tree"]
+@pytest.fixture
+def mock_tile(tile_factory):
+    """Creates a single mock Tile."""
+    # Start with no entity; assume walkable unless entity makes it not
+    return tile_factory(x=5, y=5, entity=None, walkable=True, pulse_ticks=0)
+
+class FakeGameState:
+    """Hand-written stand-in for GameState covering what the magic effects touch.
+
+    Cheaper than `MagicMock(spec=GameState)`, which walks the whole class on
+    every construction.
+    """
+    __slots__ = (
+        "map", "_placed", "add_debug_message",
+        "mycelial_network", "nexus_site", "network_distances", "calculate_network_distances",
+        "magic_fungi_locations", "dwarves", "animals", "characters", "player",
+    )
+
+    def __init__(self):
+        # Map setup
+        # Flat row-major grid indexed by y * MAP_WIDTH + x, bounds-checked like GameState.get_tile
+        self.map = [None] * (MAP_WIDTH * MAP_HEIGHT)
+        self._placed = [] # Indices written by place_tile, so reset() needn't sweep the grid
+
+        # Debugging
+        self.add_debug_message = MagicMock()
+
+        # Mycelial Network related attributes
+        self.mycelial_network = {} # {(x, y): [(nx, ny), ...]}
+        self.nexus_site = None # (x, y) or None
+        self.network_distances = {} # {(x, y): distance}
+        self.calculate_network_distances = MagicMock(return_value={}) # Mock the calculation
+
+        # Other relevant attributes
+        self.magic_fungi_locations = []
+        self.dwarves = []
+        self.animals = []
+        self.characters = [] # For NPCs
+
+        # Player (if needed by specific effects)
+        self.player = MagicMock()
+
+    def get_tile(self, x, y):
+        # Plain lookup; no test asserts on get_tile calls, so no mock bookkeeping
+        if 0 <= x < MAP_WIDTH and 0 <= y < MAP_HEIGHT:
+            return self.map[y * MAP_WIDTH + x]
+        return None
+
+    def place_tile(self, tile):
+        """Puts `tile` on the grid at its own (x, y)."""
+        index = tile.y * MAP_WIDTH + tile.x
+        self.map[index] = tile
+        self._placed.append(index)
+
+    def reset(self):
+        """Clears per-test state in place so one instance can serve a whole module."""
+        for index in self._placed:
+            self.map[index] = None
+        self._placed.clear()
+        self.mycelial_network.clear()
+        self.nexus_site = None
+        self.network_distances = {}
+        self.magic_fungi_locations.clear()
+        self.dwarves.clear()
+        self.animals.clear()
+        self.characters.clear()
+        self.add_debug_message.reset_mock()
+        self.calculate_network_distances.reset_mock()
+        self.player.reset_mock()
+
+@pytest.fixture(scope="module")
+def _game_state_base():
+    """Builds the FakeGameState once per module; see `mock_game_state`."""
+    return FakeGameState()
 
-    mock_tile.entity = fungi
-    mock_game_state.map[(mock_tile.x, mock_tile.y)] = mock_tile
+@pytest.fixture
+def mock_game_state(_game_state_base, mock_entity_registry): # Depends on registry fixture
+    """Provides the module's FakeGameState, reset for the current test."""
+    _game_state_base.reset()
+    return _game_state_base
 
-    # Place water and tree nearby
-    water_tile = MagicMock(spec=Tile, entity=water, x=mock_tile.x + 1, y=mock_tile.y)
-    mock_game_state.map[(water_tile.x, water_tile.y)] = water_tile
-    tree_tile = MagicMock(spec=Tile, entity=tree, x=mock_tile.x - 1, y=mock_tile.y)
-    mock_game_state.map[(tree_tile.x, tree_tile.y)] = tree_tile
 
-    # Ensure random check fails (random.random() >= 0.60)
-    with patch('random.random', return_value=0.65):
-        fungal_bloom_effect(mock_tile, mock_game_state)
+# --- Tests for fungal_bloom_effect ---
 
-    assert mock_tile.entity == fungi # Should remain normal fungi
+CREATED_FUNGI_MSG = "Fungal Bloom: Created fungi at ({x}, {y})"
+CONVERTED_FUNGI_MSG = "Fungal Bloom: Converted fungi to magic fungi at ({x}, {y}) with prob {prob}"
+
+# (source entity, nearby (dx, entity) placements, random roll, expected entity, expected debug message)
+# Grass/floor convert to fungi below 0.3. Fungi convert to magic fungi with a
+# base 10% chance, +30% near water and +20% near a tree.
+FUNGAL_BLOOM_CASES = [
+    pytest.param("grass", (), 0.1, "fungi", CREATED_FUNGI_MSG, id="grass_to_fungi"),
+    pytest.param("stone_floor", (), 0.1, "fungi", CREATED_FUNGI_MSG, id="stone_floor_to_fungi"),
+    pytest.param("grass", (), 0.5, "grass", None, id="grass_random_fails"),
+    pytest.param("fungi", (), 0.05, "magic_fungi", CONVERTED_FUNGI_MSG.replace("{prob}", "0.10"), id="fungi_base_chance"),
+    pytest.param("fungi", (), 0.15, "fungi", None, id="fungi_base_chance_random_fails"),
+    pytest.param("fungi", ((1, "water"),), 0.35, "magic_fungi", CONVERTED_FUNGI_MSG.replace("{prob}", "0.40"), id="fungi_near_water"),
+    pytest.param("fungi", ((1, "water"),), 0.45, "fungi", None, id="fungi_near_water_random_fails"),
+    pytest.param("fungi", ((1, "tree"),), 0.25, "magic_fungi", CONVERTED_FUNGI_MSG.replace("{prob}", "0.30"), id="fungi_near_tree"),
+    pytest.param("fungi", ((1, "tree"),), 0.35, "fungi", None, id="fungi_near_tree_random_fails"),
+    pytest.param("fungi", ((1, "water"), (-1, "tree")), 0.55, "magic_fungi", CONVERTED_FUNGI_MSG.replace("{prob}", "0.60"), id="fungi_near_water_and_tree"),
+    pytest.param("fungi", ((1, "water"), (-1, "tree")), 0.65, "fungi", None, id="fungi_near_water_and_tree_random_fails"),
+]
+
+@pytest.mark.parametrize("src_name, neighbours, roll, expected_name, expected_msg", FUNGAL_BLOOM_CASES, indirect=["roll"])
+def test_fungal_bloom_conversion(mock_game_state, ents, mock_tile, src_name, neighbours, roll, expected_name, expected_msg):
+    """Test tile conversion outcomes for each source entity, neighbourhood and random roll."""
+    mock_tile.entity = getattr(ents, src_name)
+    mock_game_state.place_tile(mock_tile)
+
+    # Place neighbours on the same row (within the 2-tile search radius)
+    for dx, name in neighbours:
+        neighbour = FakeTile(mock_tile.x + dx, mock_tile.y, entity=getattr(ents, name))
+        mock_game_state.place_tile(neighbour)
+
+    fungal_bloom_effect(mock_tile, mock_game_state)
+
+    assert mock_tile.entity == getattr(ents, expected_name)
+    if expected_name == "magic_fungi":
+        assert (mock_tile.x, mock_tile.y) in mock_game_state.magic_fungi_locations
+    if expected_msg is None:
+        mock_game_state.add_debug_message.assert_not_called()
+    else:
+        mock_game_state.add_debug_message.assert_called_with(expected_msg.format(x=mock_tile.x, y=mock_tile.y))
 
 
 # --- Other Fungal Bloom Tests ---
 
-def test_fungal_bloom_does_not_convert_occupied_tile(mock_game_state, mock_entity_registry, mock_tile):
+@pytest.mark.parametrize("roll", [0.1], indirect=True) # Random check would normally pass
+def test_fungal_bloom_does_not_convert_occupied_tile(roll, mock_game_state, ents, mock_tile):
     """Test grass/floor does not convert to fungi if occupied by a dwarf."""
-    grass = mock_entity_registry["grass"]
-    fungi = mock_entity_registry["fungi"]
-    mock_tile.entity = grass
-    mock_game_state.map[(mock_tile.x, mock_tile.y)] = mock_tile
+    mock_tile.entity = ents.grass
+    mock_game_state.place_tile(mock_tile)
 
-    # Add a dwarf at the tile location
+    # Add a dwarf at the tile location. This one keeps spec=Dwarf: the occupancy
+    # check uses isinstance(), which a plain namespace would not satisfy.
     mock_dwarf = MagicMock(spec=Dwarf, x=mock_tile.x, y=mock_tile.y, alive=True)
     mock_game_state.dwarves.append(mock_dwarf)
 
-    with patch('random.random', return_value=0.1): # Random check would normally pass
-        fungal_bloom_effect(mock_tile, mock_game_state)
+    fungal_bloom_effect(mock_tile, mock_game_state)
 
-    assert mock_tile.entity == grass # Should remain grass because of the dwarf
+    assert mock_tile.entity == ents.grass # Should remain grass because of the dwarf
     mock_game_state.add_debug_message.assert_not_called() # No conversion message
 
 
@@ -312,10 +232,6 @@ def test_fungal_bloom_does_not_convert_occupied_tile(mock_game_state, mock_entit
 # - Test logic when random check for network enhancement fails
 # - Test logic when no nearby nodes exist
 # - Test logic when mycelial_network is initially empty or None
-
-# Remove the placeholder test
-# def test_example_magic_functionality():
-#     # TODO: Replace with actual tests for magic functions/classes
-#     # Example:
-#     # assert cast_spell(some_spell, caster, target) == expected_effect
-#     assert True 
\ No newline at end of file
+#
+# Placeholder stubs for the above should carry a "TODO: ..." docstring so the
+# conftest collection hook skips them until they are implemented.
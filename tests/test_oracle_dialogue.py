@@ -1,114 +1,81 @@
 import pytest
-from unittest.mock import Mock, patch
-import curses # Import curses for key codes
+from unittest.mock import patch
 
 # Adjust imports based on your project structure
+# The gs_factory/gs/handler fixtures live in conftest.py; GameLogic tests are in
+# test_oracle_dialogue_logic.py so input-only runs don't import game_logic.
 from fungi_fortress.game_state import GameState, InteractionEventDetails
 from fungi_fortress.input_handler import InputHandler
-from fungi_fortress.characters import Dwarf, Oracle, Task
-from fungi_fortress.tiles import Tile, ENTITY_REGISTRY
-from fungi_fortress.constants import MAP_WIDTH, MAP_HEIGHT
-from fungi_fortress.game_logic import GameLogic
 from fungi_fortress.config_manager import LLMConfig
 from fungi_fortress.oracle_logic import get_canned_response
-from fungi_fortress.inventory import Inventory
-
-# Helper function to create a basic GameState with a dwarf and an oracle
-def setup_game_state_with_oracle(
-    dwarf_pos=(5, 5), 
-    oracle_pos=(6, 5), 
-    oracle_name="Test Oracle",
-    llm_config: LLMConfig = LLMConfig(api_key="test_key"),
-    offering_item: str = None,
-    offering_amount: int = 0,
-    initial_player_inventory: dict = None
-):
-    gs = GameState(llm_config=llm_config)
-    gs.dwarves = []
-    gs.characters = []
-    
-    grass = ENTITY_REGISTRY.get("grass")
-    gs.map = [[Tile(grass, x, y) for x in range(MAP_WIDTH)] for y in range(MAP_HEIGHT)]
-    gs.main_map = gs.map
-    
-    if dwarf_pos:
-        dwarf = Dwarf(dwarf_pos[0], dwarf_pos[1], 0)
-        gs.dwarves.append(dwarf)
-        gs.cursor_x, gs.cursor_y = dwarf_pos
-
-    if oracle_pos:
-        oracle = Oracle(oracle_name, oracle_pos[0], oracle_pos[1])
-        oracle.offering_item = offering_item
-        oracle.offering_amount = offering_amount
-        oracle.canned_responses = {
-            "greeting_offering": ["The Oracle requires an offering."],
-            "greeting_no_offering": ["The Oracle greets you."],
-            "no_api_key": ["The Oracle is silent, its connection dormant."],
-            "no_offering_made": ["The Oracle seems displeased by your lack of offering."],
-            "offering_accepted": ["The Oracle acknowledges your offering.", "It awaits your query... (LLM interaction pending implementation)"],
-            "insufficient_offering": ["You do not have the required offering."]
-        }
-        gs.characters.append(oracle)
-    
-    gs.task_manager.tasks = [] 
-    gs.show_oracle_dialog = False
-    gs.paused = False
-    gs.oracle_interaction_state = "IDLE"
-    gs.oracle_current_dialogue = []
-    gs.active_oracle_entity_id = None
-
-    if initial_player_inventory:
-        gs.inventory.resources = initial_player_inventory.copy()
-    else:
-        gs.inventory.resources = {"food": 10}
-    
-    return gs
-
-# --- Input Handler Tests ---
 
-def test_input_talk_assigns_task():
-    gs = setup_game_state_with_oracle()
-    oracle = next(c for c in gs.characters if isinstance(c, Oracle))
-    dwarf = gs.dwarves[0]
-    input_handler = InputHandler(gs)
+_KEY_T = ord('t')
+_KEY_Q = ord('q')
+_KEY_M = ord('m')
+_KEY_Y = ord('y')
+_KEY_N = ord('n')
+_KEY_ENTER = ord('\n') # InputHandler treats 10/13 the same as the curses Enter key
+
+# Nothing under test writes to LLMConfig, so one instance per variant is shared
+_CFG_FAKE_KEY = LLMConfig(api_key="fake_key")
+_CFG_NO_KEY = LLMConfig(api_key=None)
+
+# Mirrors GameState.oracle_offering_cost; the prompt text matches what InputHandler shows on 't'
+_OFFERING_COST_STR = ", ".join(f"{qty} {res.replace('_', ' ')}" for res, qty in {"magic_fungi": 5, "gold": 10}.items())
+
+def _offering_prompt(oracle_name):
+    """The three-line offering request shown while AWAITING_OFFERING."""
+    return [
+        f"{oracle_name} desires an offering to share deeper insights:",
+        f"({_OFFERING_COST_STR}).",
+        "Will you make this offering? (Y/N)"
+    ]
 
-    # Ensure dwarf is NOT adjacent to the oracle for this test
-    dwarf.x = oracle.x + 3 
-    dwarf.y = oracle.y + 3
-    gs.cursor_x, gs.cursor_y = oracle.x, oracle.y # Cursor on Oracle
+def _put_in_awaiting_offering(gs, oracle):
+    """Opens the dialog as InputHandler's 't' press does when an offering is required."""
+    gs.show_oracle_dialog = True
+    gs.paused = True
+    gs.oracle_interaction_state = "AWAITING_OFFERING"
+    gs.oracle_current_dialogue = _offering_prompt(oracle.name)
 
-    # Simulate 't' key press
-    input_handler.handle_input(ord('t'))
-
-    assert len(gs.task_manager.tasks) == 1
-    task = gs.task_manager.tasks[0]
-    assert task.type == 'talk'
-    # Target of the talk task should be the oracle's location
-    assert task.resource_x == oracle.x 
-    assert task.resource_y == oracle.y
-    # The task's own x,y should be an adjacent tile to the oracle
-    assert abs(task.x - oracle.x) <= 1 and abs(task.y - oracle.y) <= 1
-    assert not (task.x == oracle.x and task.y == oracle.y)
-
-def test_input_talk_already_adjacent_assigns_task(): # This test name implies a task is assigned, but if adjacent, dialog should open. Let's rename and adjust logic.
-    gs = setup_game_state_with_oracle()
-    oracle = next(c for c in gs.characters if isinstance(c, Oracle))
-    dwarf = gs.dwarves[0]
-    input_handler = InputHandler(gs)
+# --- Input Handler Tests ---
 
-    # Position dwarf adjacent to the Oracle
-    dwarf.x = oracle.x + 1
-    dwarf.y = oracle.y
+@pytest.fixture
+def gs(gs_factory):
+    """Overrides conftest's `gs`: input handling only reads the map, so skip the row copies."""
+    return gs_factory(read_only_map=True)
+
+@pytest.mark.parametrize("oracle_pos, expect_task", [
+    pytest.param((8, 8), True, id="distant_assigns_task"),
+    pytest.param((6, 5), False, id="adjacent_opens_dialog"),
+])
+def test_input_talk(gs_factory, oracle_pos, expect_task):
+    """Test 't' on the Oracle queues a talk task from afar and opens the dialog when adjacent."""
+    gs = gs_factory(dwarf_pos=(5, 5), oracle_pos=oracle_pos, read_only_map=True)
+    handler = InputHandler(gs)
+    oracle = gs.characters[0]
     gs.cursor_x, gs.cursor_y = oracle.x, oracle.y # Cursor on Oracle
 
     # Simulate 't' key press
-    input_handler.handle_input(ord('t'))
-
-    # Dialogue should start immediately, no task should be created
-    assert gs.show_oracle_dialog is True
-    assert len(gs.task_manager.tasks) == 0
-    assert gs.active_oracle_entity_id == oracle.name # Changed from oracle.entity_id
-    assert gs.oracle_interaction_state == "AWAITING_OFFERING" # Or whatever the initial state is
+    handler.handle_input(_KEY_T)
+
+    if expect_task:
+        assert len(gs.task_manager.tasks) == 1
+        task = gs.task_manager.tasks[0]
+        assert task.type == 'talk'
+        # Target of the talk task should be the oracle's location
+        assert task.resource_x == oracle.x
+        assert task.resource_y == oracle.y
+        # The task's own x,y should be an adjacent tile to the oracle
+        assert abs(task.x - oracle.x) <= 1 and abs(task.y - oracle.y) <= 1
+        assert not (task.x == oracle.x and task.y == oracle.y)
+        assert not gs.show_oracle_dialog
+    else:
+        # Dialogue should start immediately, no task should be created
+        assert gs.show_oracle_dialog is True
+        assert len(gs.task_manager.tasks) == 0
+        assert gs.active_oracle_entity_id == oracle.name
+        assert gs.oracle_interaction_state == "AWAITING_OFFERING"
 
 # This test focuses on GameLogic's role if a 'talk' task was already completed
 # For immediate dialog on 't' press when adjacent, that's an InputHandler role.
@@ -116,11 +83,9 @@ def test_input_talk_already_adjacent_assigns_task(): # This test name implies a
 # Current name: test_logic_talk_triggers_dialog_immediately_if_adjacent
 # This implies that an input 't' happened, dwarf is adjacent, and then logic processes it.
 # The input handler already directly initiates dialog if adjacent.
-def test_input_triggers_dialog_immediately_if_adjacent(): # Renamed
-    gs = setup_game_state_with_oracle()
-    oracle = next(c for c in gs.characters if isinstance(c, Oracle))
+def test_input_triggers_dialog_immediately_if_adjacent(gs, handler): # Renamed
+    oracle = gs.characters[0]
     dwarf = gs.dwarves[0]
-    input_handler = InputHandler(gs)
     # game_logic = GameLogic(gs) # GameLogic might not be needed if input handler does it all
 
     # Position dwarf adjacent to the Oracle
@@ -129,7 +94,7 @@ def test_input_triggers_dialog_immediately_if_adjacent(): # Renamed
     gs.cursor_x, gs.cursor_y = oracle.x, oracle.y
 
     # Simulate 't' key press
-    input_handler.handle_input(ord('t'))
+    handler.handle_input(_KEY_T)
 
     # Assert that the dialog mode is active and no task was created
     assert gs.show_oracle_dialog is True
@@ -139,135 +104,33 @@ def test_input_triggers_dialog_immediately_if_adjacent(): # Renamed
 
     # Optional: If GameLogic.update() had further role for an *already initiated* dialogue,
     # it could be tested here. But for *triggering* it, InputHandler is key.
-    # game_logic.update() 
+    # logic.update() 
     # assert gs.oracle_current_dialogue ... (check for initial dialogue lines)
 
-def test_input_close_dialog_t():
-    """Test pressing 't' closes the Oracle dialog."""
-    gs = setup_game_state_with_oracle()
-    oracle = next(c for c in gs.characters if isinstance(c, Oracle)) # Get the oracle
-    input_handler = InputHandler(gs)
-    
+@pytest.mark.parametrize("key, set_active_oracle, expect_open", [
+    pytest.param(_KEY_Q, True, False, id="close_with_active_oracle"),
+    pytest.param(_KEY_Q, False, False, id="close_q"),
+    pytest.param(_KEY_M, False, True, id="other_key_keeps_open"),
+])
+def test_input_dialog_key(gs, handler, key, set_active_oracle, expect_open):
+    """Test 'q' closes the Oracle dialog (and unpauses) while other keys leave it open."""
     # Open the dialog
     gs.show_oracle_dialog = True
     gs.paused = True
-    gs.active_oracle_entity_id = oracle.name # Set active oracle
-
-    # Simulate 'q' press to close (was 't')
-    input_handler.handle_input(ord('q'))
-    
-    # Check dialog is closed and game unpaused
-    assert not gs.show_oracle_dialog
-    assert not gs.paused
-
-def test_input_close_dialog_q():
-    """Test pressing 'q' closes the Oracle dialog."""
-    gs = setup_game_state_with_oracle()
-    input_handler = InputHandler(gs)
-    
-    gs.show_oracle_dialog = True
-    gs.paused = True
-    
-    input_handler.handle_input(ord('q'))
-    
-    assert not gs.show_oracle_dialog
-    assert not gs.paused
+    if set_active_oracle:
+        oracle = gs.characters[0]
+        gs.active_oracle_entity_id = oracle.name
 
-def test_input_other_keys_in_dialog():
-    """Test other keys don't close the dialog."""
-    gs = setup_game_state_with_oracle()
-    input_handler = InputHandler(gs)
-    
-    gs.show_oracle_dialog = True
-    gs.paused = True
-    
-    # Simulate another key press (e.g., 'm')
-    input_handler.handle_input(ord('m'))
-    
-    # Check dialog is still open and paused
-    assert gs.show_oracle_dialog
-    assert gs.paused
-
-# We might need more setup/mocking for a_star if it's complex or has side effects
-# For now, assume a_star works correctly based on the simple map 
-
-# --- Game Logic Tests ---
-
-# Use patch to temporarily disable mission checks during these logic tests
-@patch('fungi_fortress.game_logic.check_mission_completion', return_value=False)
-@patch('fungi_fortress.game_logic.complete_mission') # Also patch complete_mission to avoid side effects
-def test_logic_talk_triggers_dialog_after_move(mock_complete, mock_check):
-    """Test dialogue opens after dwarf completes move for 'talk' task."""
-    gs = setup_game_state_with_oracle(dwarf_pos=(1, 1), oracle_pos=(3, 1))
-    # input_handler = InputHandler(gs) # Don't need input handler for this specific logic test
-    game_logic = GameLogic(gs)
-    dwarf = gs.dwarves[0]
-    
-    # Manually create and assign the task to the dwarf
-    # Task: move to (2,1) to talk to Oracle at (3,1)
-    talk_task = Task(x=2, y=1, type='talk', resource_x=3, resource_y=1) 
-    dwarf.task = talk_task
-    dwarf.state = 'moving'
-    # Manually set path (assuming a_star would return this)
-    dwarf.path = [(2, 1)] 
-    dwarf.target_x, dwarf.target_y = 2, 1 # Set target for state machine
-    dwarf.resource_x, dwarf.resource_y = 3, 1 # Set resource target
-
-    # Initial state checks
-    assert dwarf.task is not None 
-    assert dwarf.task.type == 'talk'
-    assert dwarf.state == 'moving'
-    assert dwarf.x == 1 and dwarf.y == 1
-    assert not gs.show_oracle_dialog
-    assert not gs.paused
-    
-    # Simulate game tick for dwarf movement
-    game_logic.update() # Tick 1: Dwarf should move from (1,1) to (2,1) and trigger talk
-    
-    # Check state AFTER movement tick
-    assert dwarf.x == 2 and dwarf.y == 1 # Should be at destination now
-    assert not dwarf.path # Path should be empty
-    assert dwarf.state == 'idle' # Should become idle after talking
-    assert dwarf.task is None # Task should be cleared after talking
-    
-    # Crucially, check if dialogue was triggered
-    assert gs.show_oracle_dialog 
-    assert gs.paused
-    mock_check.assert_called() # Ensure the mock was used
-
-@patch('fungi_fortress.game_logic.check_mission_completion', return_value=False)
-@patch('fungi_fortress.game_logic.complete_mission')
-def test_logic_talk_triggers_dialog_immediately_if_adjacent(mock_complete, mock_check):
-    """Test dialogue opens immediately if dwarf is adjacent when 't' is pressed (handled by InputHandler).""" # Docstring updated
-    gs = setup_game_state_with_oracle(dwarf_pos=(5, 5), oracle_pos=(6, 5))
-    input_handler = InputHandler(gs)
-    game_logic = GameLogic(gs) # GameLogic might be used to see effects after input
-    dwarf = gs.dwarves[0]
-    oracle = next(c for c in gs.characters if isinstance(c, Oracle))
-    
-    # Assign task: Move cursor to Oracle (6,5) and press 't'
-    gs.cursor_x, gs.cursor_y = oracle.x, oracle.y # Use oracle's actual position
-    input_handler.handle_input(ord('t'))
-    
-    # Since dwarf is adjacent, InputHandler should open dialog directly, not create a task.
-    assert len(gs.task_manager.tasks) == 0 
-    assert gs.show_oracle_dialog is True
-    assert gs.active_oracle_entity_id == oracle.name
-    assert gs.oracle_interaction_state == "AWAITING_OFFERING" # Or appropriate initial state
+    handler.handle_input(key)
 
-    # Update game logic ONCE - should not change the immediate outcome of dialog opening
-    game_logic.update()
-    
-    # Check state after the single update - should still be in dialog, dwarf idle
-    assert dwarf.x == 5 and dwarf.y == 5 # Still adjacent
-    assert dwarf.state == 'idle' 
+    assert gs.show_oracle_dialog is expect_open
+    assert gs.paused is expect_open
 
 # --- Game State Tests --- (Could be in a separate file)
 
 def test_game_state_oracle_flag_default():
     """Test that show_oracle_dialog defaults to False."""
-    gs = GameState(llm_config=LLMConfig()) # Provide default LLMConfig
-    assert not gs.show_oracle_dialog
+    assert GameState(llm_config=LLMConfig()).show_oracle_dialog is False
 
 # --- Tests for _get_active_oracle (InputHandler internal method) ---
 # These might be tricky to test directly without making it public or testing via its effects.
@@ -280,16 +143,16 @@ def test_game_state_oracle_flag_default():
 
 @patch('fungi_fortress.llm_interface.handle_game_event') # Mock the LLM call
 @patch('fungi_fortress.input_handler.InputHandler._get_active_oracle')
-def test_oracle_interaction_no_api_key(mock_get_active_oracle, mock_handle_event):
+def test_oracle_interaction_no_api_key(mock_get_active_oracle, mock_handle_event, gs_factory):
     """Test interaction: no API key, no offering required by Oracle itself initially."""
     # Simulate an Oracle that doesn't require an offering to initiate dialogue
     # but the system (GameState.llm_config) has no API key.
-    gs = setup_game_state_with_oracle(
-        llm_config=LLMConfig(api_key=None), # No API Key in game state
+    gs = gs_factory(
+        llm_config=_CFG_NO_KEY, # No API Key in game state
         offering_item=None # Oracle entity itself doesn't ask for anything upfront
     )
     input_handler = InputHandler(gs)
-    oracle = next(c for c in gs.characters if isinstance(c, Oracle))
+    oracle = gs.characters[0]
     mock_get_active_oracle.return_value = oracle # Ensure this oracle is returned by the getter
     gs.active_oracle_entity_id = oracle.name # Set active oracle directly for simplicity
 
@@ -303,9 +166,9 @@ def test_oracle_interaction_no_api_key(mock_get_active_oracle, mock_handle_event
     gs.oracle_interaction_state = "AWAITING_PROMPT"
     gs.oracle_current_dialogue = get_canned_response(oracle, "greeting_no_offering")
 
-    # Player types something and presses Enter (simulated by curses.KEY_ENTER)
+    # Player types something and presses Enter (simulated by a newline)
     gs.oracle_prompt_buffer = "Hello Oracle!"
-    input_handler.handle_input(curses.KEY_ENTER)
+    input_handler.handle_input(_KEY_ENTER)
 
     # Because there's no API key in gs.llm_config, handle_game_event (when called via GameLogic)
     # should eventually lead to an add_oracle_dialogue action with the "no_api_key" message.
@@ -321,14 +184,14 @@ def test_oracle_interaction_no_api_key(mock_get_active_oracle, mock_handle_event
 
 @patch('fungi_fortress.llm_interface.handle_game_event') # Mock the LLM call
 @patch('fungi_fortress.input_handler.InputHandler._get_active_oracle')
-def test_oracle_interaction_with_api_key_no_offering_required(mock_get_active_oracle, mock_handle_event):
+def test_oracle_interaction_with_api_key_no_offering_required(mock_get_active_oracle, mock_handle_event, gs_factory):
     """Test interaction: API key present, no offering required by Oracle."""
-    gs = setup_game_state_with_oracle(
-        llm_config=LLMConfig(api_key="fake_key"), # API key is present
+    gs = gs_factory(
+        llm_config=_CFG_FAKE_KEY, # API key is present
         offering_item=None # Oracle does not require an offering item
     )
     input_handler = InputHandler(gs)
-    oracle = next(c for c in gs.characters if isinstance(c, Oracle))
+    oracle = gs.characters[0]
     mock_get_active_oracle.return_value = oracle
     gs.active_oracle_entity_id = oracle.name
 
@@ -340,7 +203,7 @@ def test_oracle_interaction_with_api_key_no_offering_required(mock_get_active_or
 
     # Player types prompt and presses Enter
     gs.oracle_prompt_buffer = "What is the weather like?"
-    input_handler.handle_input(curses.KEY_ENTER)
+    input_handler.handle_input(_KEY_ENTER)
 
     # An ORACLE_QUERY event should be created
     assert any(event['type'] == 'ORACLE_QUERY' for event in gs.event_queue)
@@ -350,32 +213,24 @@ def test_oracle_interaction_with_api_key_no_offering_required(mock_get_active_or
     # GameLogic would then process this event, calling mock_handle_event.
     # mock_handle_event.assert_called_once() # This would be asserted after GameLogic.update()
 
-def test_oracle_interaction_successful_offering():
+def test_oracle_interaction_successful_offering(gs_factory):
     """Test interaction: API key present, offering required and met."""
     # GameState.oracle_offering_cost is {"magic_fungi": 5, "gold": 10}
-    gs = setup_game_state_with_oracle(
-        llm_config=LLMConfig(api_key="fake_key"), # Renamed OracleConfig to LLMConfig
+    gs = gs_factory(
+        llm_config=_CFG_FAKE_KEY,
         initial_player_inventory={"magic_fungi": 10, "gold": 20, "food": 5} # Ensure enough for GS cost
     )
     input_handler = InputHandler(gs)
-    oracle = next(c for c in gs.characters if isinstance(c, Oracle))
+    oracle = gs.characters[0]
     gs.active_oracle_entity_id = oracle.name
     initial_magic_fungi = gs.inventory.resources.get("magic_fungi", 0)
     initial_gold = gs.inventory.resources.get("gold", 0)
 
     # Simulate the state InputHandler expects when dialogue opens via 't' keypress
-    gs.show_oracle_dialog = True
-    gs.paused = True
-    gs.oracle_interaction_state = "AWAITING_OFFERING" # Set by 't' press logic in InputHandler
-    offering_cost_str = ", ".join([f"{qty} {res.replace('_', ' ')}" for res, qty in gs.oracle_offering_cost.items()])
-    gs.oracle_current_dialogue = [
-        f"{oracle.name} desires an offering to share deeper insights:",
-        f"({offering_cost_str}).",
-        "Will you make this offering? (Y/N)"
-    ] # Set by 't' press logic
+    _put_in_awaiting_offering(gs, oracle)
 
     # Player presses 'y' to make offering
-    input_handler.handle_input(ord('y'))
+    input_handler.handle_input(_KEY_Y)
 
     assert gs.oracle_interaction_state == "AWAITING_PROMPT"
     # Dialogue set by InputHandler directly after successful offering
@@ -384,56 +239,50 @@ def test_oracle_interaction_successful_offering():
     assert gs.inventory.resources.get("gold", 0) == initial_gold - gs.oracle_offering_cost.get("gold", 0)
     # assert (oracle.id, "offering_made") in InteractionEventDetails.handled_interactions # Re-evaluate InteractionEventDetails later
 
-def test_oracle_interaction_decline_offering():
+def test_oracle_interaction_decline_offering(gs_factory):
     """Test interaction: Player declines to make an offering."""
-    gs = setup_game_state_with_oracle(
-        llm_config=LLMConfig(api_key="fake_key"),
+    gs = gs_factory(
+        llm_config=_CFG_FAKE_KEY,
         offering_item="magic_fungi", # These are for oracle entity, not gs.oracle_offering_cost
         offering_amount=1,
-        initial_player_inventory={"magic_fungi": 2}
+        initial_player_inventory={"magic_fungi": 2},
+        copy_inventory=False
     )
     input_handler = InputHandler(gs)
-    oracle = next(c for c in gs.characters if isinstance(c, Oracle))
+    oracle = gs.characters[0]
     gs.active_oracle_entity_id = oracle.name
     initial_fungi = gs.inventory.resources.get("magic_fungi", 0) # Get initial amount
 
     # Simulate the state InputHandler expects when dialogue opens via 't' keypress
-    gs.show_oracle_dialog = True
-    gs.oracle_interaction_state = "AWAITING_OFFERING"
+    _put_in_awaiting_offering(gs, oracle)
 
     # Player presses 'n' to decline
-    input_handler.handle_input(ord('n'))
+    input_handler.handle_input(_KEY_N)
 
     assert gs.oracle_interaction_state == "SHOWING_CANNED_RESPONSE"
     assert gs.oracle_current_dialogue == get_canned_response(oracle, "no_offering_made")
     assert gs.inventory.resources.get("magic_fungi", 0) == initial_fungi # Unchanged
     # assert (oracle.name, "offering_declined") in InteractionEventDetails.handled_interactions
 
-def test_oracle_interaction_insufficient_offering():
+def test_oracle_interaction_insufficient_offering(gs_factory):
     """Test interaction: Player tries to offer but has insufficient items."""
     # GameState.oracle_offering_cost is {"magic_fungi": 5, "gold": 10}
-    gs = setup_game_state_with_oracle(
-        llm_config=LLMConfig(api_key="fake_key"),
-        initial_player_inventory={"magic_fungi": 1, "gold": 1} # Not enough for GS cost
+    gs = gs_factory(
+        llm_config=_CFG_FAKE_KEY,
+        initial_player_inventory={"magic_fungi": 1, "gold": 1}, # Not enough for GS cost
+        copy_inventory=False
     )
     input_handler = InputHandler(gs)
-    oracle = next(c for c in gs.characters if isinstance(c, Oracle))
+    oracle = gs.characters[0]
     gs.active_oracle_entity_id = oracle.name # Changed from oracle.id
     initial_magic_fungi = gs.inventory.resources.get("magic_fungi", 0) # Get initial amount
     initial_gold = gs.inventory.resources.get("gold", 0) # Get initial amount
 
     # Simulate the state InputHandler expects when dialogue opens via 't' keypress
-    gs.show_oracle_dialog = True
-    gs.oracle_interaction_state = "AWAITING_OFFERING" # Set by 't' press logic in InputHandler
-    offering_cost_str_initial_prompt = ", ".join([f"{qty} {res.replace('_',' ')}" for res, qty in gs.oracle_offering_cost.items()])
-    gs.oracle_current_dialogue = [
-        f"{oracle.name} desires an offering to share deeper insights:",
-        f"({offering_cost_str_initial_prompt}).",
-        "Will you make this offering? (Y/N)"
-    ] # Set by 't' press logic
+    _put_in_awaiting_offering(gs, oracle)
 
     # Player presses 'y' to make offering (but can't)
-    input_handler.handle_input(ord('y'))
+    input_handler.handle_input(_KEY_Y)
 
     # InputHandler._handle_offering sets its own dialogue on failure
     # It then returns False, and the main handle_input loop for AWAITING_OFFERING calls
@@ -462,16 +311,15 @@ def test_oracle_interaction_insufficient_offering():
 
 # Let's refine one test (e.g., successful offering) to use this approach.
 
-@patch('fungi_fortress.input_handler.InputHandler._get_active_oracle') # Mock to control which oracle is active
-def test_oracle_interaction_successful_offering_refined(mock_get_active_oracle):
+def test_oracle_interaction_successful_offering_refined(gs_factory):
     """Refined Test: API key present, offering required and met."""
-    gs = setup_game_state_with_oracle(
-        llm_config=LLMConfig(api_key="fake_key"),
+    gs = gs_factory(
+        llm_config=_CFG_FAKE_KEY,
         # offering_item for Oracle entity is not used by 't' press if API key is present global cost is used
         initial_player_inventory={"magic_fungi": 10, "gold": 20, "food": 5} 
     )
     input_handler = InputHandler(gs)
-    oracle = next(c for c in gs.characters if isinstance(c, Oracle))
+    oracle = gs.characters[0]
     dwarf = gs.dwarves[0] # Get the dwarf
 
     # Ensure dwarf is adjacent to the oracle for direct dialog
@@ -480,20 +328,20 @@ def test_oracle_interaction_successful_offering_refined(mock_get_active_oracle):
     gs.cursor_x, gs.cursor_y = oracle.x, oracle.y
 
 
-    mock_get_active_oracle.return_value = oracle 
+    input_handler._get_active_oracle = lambda: oracle # Control which oracle is active, without a Mock
     gs.active_oracle_entity_id = oracle.name 
 
     gs.show_oracle_dialog = False # Ensure dialog is not initially open
     gs.oracle_interaction_state = "IDLE" # Start from IDLE
 
     # Simulate 't' key press to initiate interaction
-    input_handler.handle_input(ord('t')) 
+    input_handler.handle_input(_KEY_T) 
     
     assert gs.show_oracle_dialog is True # Dialog should now be open
     assert gs.oracle_interaction_state == "AWAITING_OFFERING" # Should transition due to API key
 
     # Now, simulate player pressing 'y' to make the offering
-    input_handler.handle_input(ord('y'))
+    input_handler.handle_input(_KEY_Y)
 
     assert gs.oracle_interaction_state == "AWAITING_PROMPT"
     # Dialogue set by InputHandler directly after successful offering
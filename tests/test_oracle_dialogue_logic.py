@@ -0,0 +1,108 @@
+import pytest
+
+# The gs/handler fixtures live in conftest.py
+from fungi_fortress.characters import Task
+from fungi_fortress.game_logic import GameLogic
+
+_KEY_T = ord('t')
+
+@pytest.fixture
+def logic(gs):
+    """A GameLogic bound to the default `gs`."""
+    return GameLogic(gs)
+
+@pytest.fixture
+def straight_path(monkeypatch):
+    """Replaces game_logic's a_star with a one-step path straight to the goal.
+
+    The dialogue tests only care about what happens on arrival, so any
+    re-planning during update() should not search the whole grass map.
+    """
+    monkeypatch.setattr('fungi_fortress.game_logic.a_star', lambda game_map, start, goal: [goal])
+
+# --- Game Logic Tests ---
+
+class _Counter:
+    """Minimal call-counting stub; cheaper than a Mock when only the call count matters."""
+    def __init__(self, return_value=None):
+        self.n = 0
+        self.return_value = return_value
+
+    def __call__(self, *args, **kwargs):
+        self.n += 1
+        return self.return_value
+
+@pytest.fixture
+def mission_check(monkeypatch):
+    """Disables mission checks during logic tests; returns the counting stub.
+
+    complete_mission is stubbed too, to avoid side effects.
+    """
+    check = _Counter(return_value=False)
+    monkeypatch.setattr('fungi_fortress.game_logic.check_mission_completion', check)
+    monkeypatch.setattr('fungi_fortress.game_logic.complete_mission', _Counter())
+    return check
+
+@pytest.mark.slow
+def test_logic_talk_triggers_dialog_after_move(mission_check, straight_path, gs_factory):
+    """Test dialogue opens after dwarf completes move for 'talk' task."""
+    gs = gs_factory(dwarf_pos=(1, 1), oracle_pos=(3, 1))
+    # input_handler = InputHandler(gs) # Don't need input handler for this specific logic test
+    game_logic = GameLogic(gs)
+    dwarf = gs.dwarves[0]
+    
+    # Manually create and assign the task to the dwarf
+    # Task: move to (2,1) to talk to Oracle at (3,1)
+    talk_task = Task(x=2, y=1, type='talk', resource_x=3, resource_y=1) 
+    dwarf.task = talk_task
+    dwarf.state = 'moving'
+    # Manually set path (assuming a_star would return this)
+    dwarf.path = [(2, 1)] 
+    dwarf.target_x, dwarf.target_y = 2, 1 # Set target for state machine
+    dwarf.resource_x, dwarf.resource_y = 3, 1 # Set resource target
+
+    # Initial state checks
+    assert dwarf.task is not None 
+    assert dwarf.task.type == 'talk'
+    assert dwarf.state == 'moving'
+    assert dwarf.x == 1 and dwarf.y == 1
+    assert not gs.show_oracle_dialog
+    assert not gs.paused
+    
+    # Simulate game tick for dwarf movement
+    game_logic.update() # Tick 1: Dwarf should move from (1,1) to (2,1) and trigger talk
+    
+    # Check state AFTER movement tick
+    assert dwarf.x == 2 and dwarf.y == 1 # Should be at destination now
+    assert not dwarf.path # Path should be empty
+    assert dwarf.state == 'idle' # Should become idle after talking
+    assert dwarf.task is None # Task should be cleared after talking
+    
+    # Crucially, check if dialogue was triggered
+    assert gs.show_oracle_dialog 
+    assert gs.paused
+    assert mission_check.n > 0 # Ensure the stub was used
+
+@pytest.mark.slow
+def test_logic_talk_triggers_dialog_immediately_if_adjacent(mission_check, straight_path, gs, handler, logic):
+    """Test dialogue opens immediately if dwarf is adjacent when 't' is pressed (handled by InputHandler).""" # Docstring updated
+    # Default placement: dwarf at (5, 5), oracle at (6, 5); logic is used to see effects after input
+    dwarf = gs.dwarves[0]
+    oracle = gs.characters[0]
+    
+    # Assign task: Move cursor to Oracle (6,5) and press 't'
+    gs.cursor_x, gs.cursor_y = oracle.x, oracle.y # Use oracle's actual position
+    handler.handle_input(_KEY_T)
+    
+    # Since dwarf is adjacent, InputHandler should open dialog directly, not create a task.
+    assert len(gs.task_manager.tasks) == 0 
+    assert gs.show_oracle_dialog is True
+    assert gs.active_oracle_entity_id == oracle.name
+    assert gs.oracle_interaction_state == "AWAITING_OFFERING" # Or appropriate initial state
+
+    # Update game logic ONCE - should not change the immediate outcome of dialog opening
+    logic.update()
+    
+    # Check state after the single update - should still be in dialog, dwarf idle
+    assert dwarf.x == 5 and dwarf.y == 5 # Still adjacent
+    assert dwarf.state == 'idle' 
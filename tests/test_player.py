@@ -35,6 +35,15 @@ def test_player_initialization_custom_stats():
     assert player.spell_slots[1] == "Boom"
     assert player.spell_slots[2] is None # Check remaining slots are empty
 
+def test_player_learning_spell_leaves_starting_stats_untouched():
+    """Test that spells learned by one Player do not leak into the next default Player."""
+    player = Player()
+    player.spells.append("Reward spell")
+
+    next_player = Player()
+    assert next_player.spells == STARTING_PLAYER_STATS.get('spells')
+    assert "Reward spell" not in next_player.spell_slots
+
 def test_player_update_state():
     """Test updating player attributes via update_state."""
     player = Player()
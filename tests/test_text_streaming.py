@@ -24,6 +24,23 @@ def test_narrative_action_separation():
     
     print("✓ Narrative/action separation test completed\n")
 
+def test_legacy_action_parsing_reports_malformed_actions():
+    """Unparseable ACTION:: segments are folded into the narrative instead of raising."""
+    response = "The spores stir. ACTION::nodetails ACTION::data::{'key': 'value\"'} ACTION::add_message::{'text': 'Glow'}"
+    narrative, actions = text_streaming_engine.separate_narrative_from_actions(response)
+    assert narrative.startswith("The spores stir.")
+    assert "(The Oracle made an unclear gesture: nodetails)" in narrative
+    assert "(The Oracle's words concerning an action were muddled: data::{'key': 'value\"'})" in narrative
+    assert actions == [{"action_type": "add_message", "details": {"text": "Glow"}}]
+
+def test_stream_builders_split_text():
+    """Word and sentence streams keep their separators so the pieces rejoin to the text."""
+    text = "Spores drift. The network hums. All is well"
+    assert text_streaming_engine.create_character_stream("abc") == ["a", "b", "c"]
+    assert "".join(text_streaming_engine.create_word_stream(text)) == text
+    assert text_streaming_engine.create_sentence_stream(text) == ["Spores drift", ". The network hums", ". All is well"]
+    assert text_streaming_engine.create_word_stream("") == []
+
 def test_flavor_text_generation():
     """Test that the streaming engine can generate flavor text."""
     print("Testing flavor text generation...")
@@ -38,6 +55,14 @@ def test_flavor_text_generation():
     
     print("✓ Flavor text generation test completed\n")
 
+def test_flavor_text_fills_placeholders():
+    """Selected flavor lines name the Oracle and environment, with no template fields left over."""
+    flavor_texts = text_streaming_engine.create_oracle_flavor_text("Ancient Sporekeeper", "consultation", "mystical chamber")
+    assert 2 <= len(flavor_texts) <= 3
+    assert len(set(flavor_texts)) == len(flavor_texts)
+    for text in flavor_texts:
+        assert "{" not in text and "}" not in text
+
 def test_streaming_sequence():
     """Test the complete Oracle streaming sequence."""
     print("Testing complete Oracle streaming sequence...")
@@ -90,6 +115,29 @@ def test_streaming_sequence():
     
     print(f"\n✓ Streaming sequence test completed ({action_count} actions)\n")
 
+def test_streaming_sequence_streams_narrative_before_response_completes():
+    """Legacy narrative is streamed while the LLM is still generating, and matches the parsed narrative."""
+    response_chunks = ["The spores ", "whisper of ", "a hidden cave.", " ACTION::add_message::", "{\"text\": \"Glow\"}"]
+    chunks_requested = []
+
+    def slow_llm_response():
+        for chunk in response_chunks:
+            chunks_requested.append(chunk)
+            yield chunk
+
+    streamed_text = ""
+    chunks_requested_at_first_narrative = None
+    for action in text_streaming_engine.start_oracle_streaming_sequence("Test Oracle", "Where?", slow_llm_response()):
+        if action["action_type"] != "stream_text_chunk":
+            continue
+        streamed_text += action["details"]["text"]
+        if chunks_requested_at_first_narrative is None and "The spores" in streamed_text:
+            chunks_requested_at_first_narrative = len(chunks_requested)
+
+    assert chunks_requested_at_first_narrative is not None
+    assert chunks_requested_at_first_narrative < len(response_chunks)
+    assert streamed_text.endswith("\nTest Oracle speaks:\nThe spores whisper of a hidden cave.\n")
+
 # Pytest will discover and run functions starting with "test_"
 # The __main__ block is not needed for pytest execution but can be kept for direct script running if desired.
 # For now, let's remove it to make it a pure pytest file.
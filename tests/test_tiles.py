@@ -1,6 +1,7 @@
 import pytest
+from unittest.mock import MagicMock
 from fungi_fortress.tiles import Tile, ENTITY_REGISTRY
-from fungi_fortress.entities import GameEntity # Need base class for type checks
+from fungi_fortress.entities import GameEntity, Structure # Need base class for type checks
 
 # Get some sample entities from the registry for testing
 sample_walkable_entity = ENTITY_REGISTRY["grass"]
@@ -68,6 +69,17 @@ def test_tile_str_representation():
     tile = Tile(entity=sample_walkable_entity, x=1, y=1)
     assert str(tile) == sample_walkable_entity.name
 
-# Note: Testing the Tile.interact() method would require mocking GameState
-# and potentially the interaction logic functions, which is more complex
-# and suitable for integration testing or specific interaction tests. 
\ No newline at end of file
+def test_tile_interact_dispatches_to_entity():
+    """Tile.interact runs a structure's logic and only logs for plain terrain."""
+    game_state = MagicMock()
+    logic = MagicMock()
+    structure = Structure(name="Test Shrine", char="S", color=1, walkable=True, interaction_logic=logic)
+    structure_tile = Tile(entity=structure, x=2, y=3)
+    structure_tile.interact(game_state)
+    logic.assert_called_once_with(game_state, structure_tile, structure)
+
+    Tile(entity=sample_walkable_entity, x=1, y=1).interact(game_state)
+    game_state.add_debug_message.assert_called_once_with(f"Nothing to interact with: {sample_walkable_entity.name}")
+
+# Note: The real interaction logic functions are exercised by integration tests;
+# the dispatch test above only checks that Tile.interact reaches them. 
\ No newline at end of file
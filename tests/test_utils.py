@@ -1,5 +1,5 @@
 import pytest
-from fungi_fortress.utils import wrap_text, a_star
+from fungi_fortress.utils import wrap_text, a_star, find_path_on_network
 
 # --- Tests for wrap_text --- 
 
@@ -40,6 +40,12 @@ def test_wrap_text_with_newlines():
     assert wrap_text(text, width) == ["First line.", "Second line."]
 
 
+def test_wrap_text_repeat_calls_return_independent_lists():
+    # Results are memoised, so mutating one caller's lines must not leak into the next call
+    first = wrap_text("This is a simple test case.", 10)
+    first.append("extra")
+    assert wrap_text("This is a simple test case.", 10) == ["This is a", "simple", "test case."]
+
 # --- Tests for a_star --- 
 
 # Helper class to mock Tiles for pathfinding tests
@@ -128,4 +134,32 @@ def test_a_star_adjacent_no_walkable_neighbor(simple_grid):
     start = (0, 0)
     goal = (1, 1) # Wall, now surrounded by walls
     path = a_star(simple_grid, start, goal, adjacent=True)
-    assert path is None # Cannot reach any walkable adjacent tile 
\ No newline at end of file
+    assert path is None # Cannot reach any walkable adjacent tile 
+
+# --- Tests for find_path_on_network ---
+
+@pytest.fixture
+def branching_network():
+    # (0,0) - (1,0) - (2,0) - (2,1)
+    #   |
+    # (0,1) - (0,2)
+    return {
+        (0, 0): [(1, 0), (0, 1)],
+        (1, 0): [(0, 0), (2, 0)],
+        (2, 0): [(1, 0), (2, 1)],
+        (2, 1): [(2, 0)],
+        (0, 1): [(0, 0), (0, 2)],
+        (0, 2): [(0, 1)],
+    }
+
+def test_find_path_on_network_shortest_path(branching_network):
+    path = find_path_on_network(branching_network, (0, 2), (2, 1))
+    assert path == [(0, 2), (0, 1), (0, 0), (1, 0), (2, 0), (2, 1)]
+
+def test_find_path_on_network_start_equals_end(branching_network):
+    assert find_path_on_network(branching_network, (0, 0), (0, 0)) == [(0, 0)]
+
+def test_find_path_on_network_unknown_or_unreachable(branching_network):
+    assert find_path_on_network(branching_network, (0, 0), (9, 9)) is None
+    branching_network[(5, 5)] = []
+    assert find_path_on_network(branching_network, (0, 0), (5, 5)) is None
@@ -10,10 +10,11 @@ data/actions (which should be processed immediately) to provide a smooth
 user experience while maintaining game mechanics integration.
 """
 
+import json
 import time
 import random
 from typing import Iterator, Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 class StreamingTextType(Enum):
@@ -25,18 +26,32 @@ class StreamingTextType(Enum):
     FLAVOR_TEXT = "flavor_text"
     SYSTEM_MESSAGE = "system_message"
 
-@dataclass
+# Enum .value is a descriptor lookup; stream actions read it for every chunk
+_TYPE_VALUES: Dict[StreamingTextType, str] = {t: t.value for t in StreamingTextType}
+
+@dataclass(slots=True) # No per-instance __dict__; chunks may be created per character
 class StreamingTextChunk:
     """Represents a chunk of text to be streamed."""
     text: str
     text_type: StreamingTextType
     delay_ms: int = 50  # Delay between characters in milliseconds
     is_complete: bool = False
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+# Separates narrative from each action in legacy (non-JSON) LLM responses
+_ACTION_MARKER = "ACTION::"
 
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+# Flavor lines for Oracle consultations; {oracle} and {env} are filled in per call
+_FLAVOR_TEMPLATES = (
+    "You approach {oracle} with reverence, seeking wisdom in this {env}.",
+    "The air grows thick with ancient spores as {oracle} prepares to commune with the mycelial network.",
+    "Bioluminescent fungi pulse gently around the chamber, responding to {oracle}'s presence.",
+    "{oracle} inhales deeply, drawing knowledge from the vast fungal consciousness.",
+    "The {env} falls silent except for the soft whisper of spores in the air.",
+    "You sense the weight of countless ages as {oracle} connects to the ancient wisdom.",
+    "Tendrils of mycelium beneath your feet seem to vibrate with anticipation.",
+    "The Oracle's eyes begin to glow with an otherworldly light as the connection strengthens.",
+)
 
 class TextStreamingEngine:
     """
@@ -56,6 +71,10 @@ class TextStreamingEngine:
         # Pause duration between larger text blocks (e.g., flavor text lines)
         self.inter_chunk_pause_ms: int = 800 # Formerly oracle_flavor_pause_ms
 
+        # Characters per stream_text_chunk action. delay_ms stays a per-character
+        # delay; the game loop reveals each chunk one character at a time.
+        self.stream_chunk_size: int = 16
+
         # Default delays dictionary - simplified, primarily for non-character-streamed types or future use
         # For character streamed text, default_character_delay_ms is the source of truth.
         self.default_delays = {
@@ -67,29 +86,24 @@ class TextStreamingEngine:
             StreamingTextType.SYSTEM_MESSAGE: 10, # System messages can remain very fast
         }
     
-    def create_character_stream(self, text: str, char_delay_ms: int = 30) -> Iterator[str]:
-        """Create a character-by-character streaming iterator."""
-        for char in text:
-            yield char
-            # Note: Actual delay timing is handled by the game loop, not here
+    # The stream builders below return lists rather than generators: the whole
+    # text is already in memory, and iterating a list is cheaper than resuming
+    # a generator once per piece. Callers can still loop over them or call iter().
     
-    def create_word_stream(self, text: str, word_delay_ms: int = 100) -> Iterator[str]:
-        """Create a word-by-word streaming iterator."""
+    def create_character_stream(self, text: str, char_delay_ms: int = 30) -> List[str]:
+        """Create a character-by-character stream."""
+        # Note: Actual delay timing is handled by the game loop, not here
+        return list(text)
+    
+    def create_word_stream(self, text: str, word_delay_ms: int = 100) -> List[str]:
+        """Create a word-by-word stream."""
         words = text.split()
-        for i, word in enumerate(words):
-            if i == 0:
-                yield word
-            else:
-                yield " " + word
+        return words[:1] + [" " + word for word in words[1:]]
     
-    def create_sentence_stream(self, text: str, sentence_delay_ms: int = 500) -> Iterator[str]:
-        """Create a sentence-by-sentence streaming iterator."""
+    def create_sentence_stream(self, text: str, sentence_delay_ms: int = 500) -> List[str]:
+        """Create a sentence-by-sentence stream."""
         sentences = text.split('. ')
-        for i, sentence in enumerate(sentences):
-            if i == 0:
-                yield sentence
-            else:
-                yield ". " + sentence
+        return sentences[:1] + [". " + sentence for sentence in sentences[1:]]
     
     def separate_narrative_from_actions(self, llm_response: str) -> Tuple[str, List[Dict[str, Any]]]:
         """
@@ -98,64 +112,64 @@ class TextStreamingEngine:
         This handles both structured JSON responses and legacy text format with ACTION:: markers.
         Returns the narrative text (for streaming) and a list of actions (for immediate processing).
         """
-        import json
-        
-        # First, try to parse as structured JSON (XAI structured outputs)
-        try:
-            parsed_json = json.loads(llm_response.strip())
-            if isinstance(parsed_json, dict) and "narrative" in parsed_json and "actions" in parsed_json:
-                narrative = parsed_json["narrative"]
-                actions = parsed_json["actions"]
-                
-                # Validate actions structure
-                validated_actions = []
-                for action in actions:
-                    if isinstance(action, dict) and "action_type" in action and "details" in action:
-                        validated_actions.append(action)
-                
-                return narrative, validated_actions
-        except json.JSONDecodeError:
-            # Not JSON, fall back to legacy text parsing
-            pass
-        except Exception:
-            # Error parsing structured JSON, fall back to text parsing
-            pass
+        # First, try to parse as structured JSON (XAI structured outputs).
+        # Only text that looks like a JSON object is tried, so legacy responses
+        # skip the exception-driven parse attempt entirely.
+        stripped_response = llm_response.strip()
+        if stripped_response.startswith("{"):
+            try:
+                parsed_json = json.loads(stripped_response)
+                if isinstance(parsed_json, dict) and "narrative" in parsed_json and "actions" in parsed_json:
+                    narrative = parsed_json["narrative"]
+                    actions = parsed_json["actions"]
+                    
+                    # Validate actions structure
+                    validated_actions = []
+                    for action in actions:
+                        if isinstance(action, dict) and "action_type" in action and "details" in action:
+                            validated_actions.append(action)
+                    
+                    return narrative, validated_actions
+            except json.JSONDecodeError:
+                # Not JSON, fall back to legacy text parsing
+                pass
+            except Exception:
+                # Error parsing structured JSON, fall back to text parsing
+                pass
         
         # Legacy text parsing for ACTION:: format
         narrative_parts = []
         actions = []
-        parts = llm_response.split("ACTION::")
+        parts = llm_response.split(_ACTION_MARKER)
         
         if parts:
             narrative_parts.append(parts[0].strip())  # First part is always narrative
             
             for part in parts[1:]:
+                action_def = part.strip()
+                # Expecting format: action_type::{json_details}
+                action_type, separator, json_details_str = action_def.partition("::")
+                if not separator:
+                    # Malformed action string
+                    narrative_parts.append(f"(The Oracle made an unclear gesture: {action_def})")
+                    continue
+                
+                # Try to parse the JSON
+                details = None
                 try:
-                    action_def = part.strip()
-                    # Expecting format: action_type::{json_details}
-                    action_type, json_details_str = action_def.split("::", 1)
-                    
-                    # Try to parse the JSON
-                    details = None
+                    details = json.loads(json_details_str)
+                except json.JSONDecodeError:
+                    # Try fixing single quotes to double quotes
                     try:
-                        details = json.loads(json_details_str)
+                        fixed_json = json_details_str.replace("'", '"')
+                        details = json.loads(fixed_json)
                     except json.JSONDecodeError:
-                        # Try fixing single quotes to double quotes
-                        try:
-                            fixed_json = json_details_str.replace("'", '"')
-                            details = json.loads(fixed_json)
-                        except json.JSONDecodeError:
-                            # Skip malformed action, add error to narrative
-                            narrative_parts.append(f"(The Oracle's words concerning an action were muddled: {action_type}::{json_details_str})")
-                            continue
-                    
-                    if details is not None:
-                        actions.append({"action_type": action_type.strip(), "details": details})
-                        
-                except ValueError:
-                    # Malformed action string
-                    narrative_parts.append(f"(The Oracle made an unclear gesture: {part.strip()})")
-                    continue
+                        # Skip malformed action, add error to narrative
+                        narrative_parts.append(f"(The Oracle's words concerning an action were muddled: {action_type}::{json_details_str})")
+                        continue
+                
+                if details is not None:
+                    actions.append({"action_type": action_type.strip(), "details": details})
         
         narrative = " ".join(narrative_parts).strip()
         return narrative, actions
@@ -173,22 +187,11 @@ class TextStreamingEngine:
         Returns:
             List of flavor text strings to be streamed before the LLM response
         """
-        flavor_templates = [
-            f"You approach {oracle_name} with reverence, seeking wisdom in this {environment}.",
-            f"The air grows thick with ancient spores as {oracle_name} prepares to commune with the mycelial network.",
-            f"Bioluminescent fungi pulse gently around the chamber, responding to {oracle_name}'s presence.",
-            f"{oracle_name} inhales deeply, drawing knowledge from the vast fungal consciousness.",
-            f"The {environment} falls silent except for the soft whisper of spores in the air.",
-            f"You sense the weight of countless ages as {oracle_name} connects to the ancient wisdom.",
-            f"Tendrils of mycelium beneath your feet seem to vibrate with anticipation.",
-            f"The Oracle's eyes begin to glow with an otherworldly light as the connection strengthens.",
-        ]
-        
-        # Select 2-3 random flavor texts
+        # Select 2-3 random flavor texts, formatting only the ones picked
         selected_count = random.randint(2, 3)
-        selected_texts = random.sample(flavor_templates, min(selected_count, len(flavor_templates)))
+        selected_templates = random.sample(_FLAVOR_TEMPLATES, min(selected_count, len(_FLAVOR_TEMPLATES)))
         
-        return selected_texts
+        return [template.format(oracle=oracle_name, env=environment) for template in selected_templates]
     
     def create_oracle_waiting_text(self, oracle_name: str) -> List[str]:
         """
@@ -217,7 +220,7 @@ class TextStreamingEngine:
         
         details = {
             "text": text,
-            "text_type": text_type.value,
+            "text_type": _TYPE_VALUES[text_type],
             "target": target,
             "delay_ms": current_delay,
             "add_newline": add_newline
@@ -226,90 +229,126 @@ class TextStreamingEngine:
             details["is_error"] = True
         return {"action_type": "stream_text_chunk", "details": details}
 
+    def _create_stream_chunk_actions(self, text: str, text_type: StreamingTextType,
+                                     is_error: bool = False,
+                                     chunk_size: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yields \'stream_text_chunk\' actions covering `text`, `chunk_size` characters at a time."""
+        if chunk_size is None:
+            chunk_size = self.stream_chunk_size
+        # Every chunk shares the same fields apart from its text, so build them once
+        template = self._create_stream_chunk_action(
+            text="", text_type=text_type, add_newline=False, is_error=is_error
+        )["details"]
+        for i in range(0, len(text), chunk_size):
+            details = template.copy()
+            details["text"] = text[i:i + chunk_size]
+            yield {"action_type": "stream_text_chunk", "details": details}
+
+    def _create_line_stream_actions(self, lines: List[str], text_type: StreamingTextType,
+                                    pause_ms: int = 0, is_error: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yields chunk actions for each line followed by its newline, and an optional pause after each."""
+        for line in lines:
+            yield from self._create_stream_chunk_actions(line, text_type, is_error=is_error)
+            # The newline is streamed as its own chunk, like another character
+            yield self._create_stream_chunk_action(text='\n', text_type=text_type, add_newline=False, is_error=is_error)
+            if pause_ms:
+                yield {"action_type": "stream_pause", "details": {"duration_ms": pause_ms}}
+
+    def _create_oracle_speaks_actions(self, oracle_name: str) -> Iterator[Dict[str, Any]]:
+        """Yields the "\\n<Oracle> speaks:" line that introduces the Oracle's narrative."""
+        yield from self._create_stream_chunk_actions(f"\n{oracle_name} speaks:", StreamingTextType.ORACLE_DIALOGUE)
+        yield self._create_stream_chunk_action(
+            text='\n',
+            text_type=StreamingTextType.ORACLE_DIALOGUE,
+            add_newline=False
+        )
+
+    @staticmethod
+    def _split_streamable_narrative(pending: str) -> Tuple[str, str, bool]:
+        """Splits received legacy narrative into the part that is safe to stream now and the rest.
+
+        Returns (ready_text, still_pending, reached_actions). Once an ACTION::
+        marker arrives, the text before it is the end of the narrative. Until
+        then, a tail that could be a partial marker, and any trailing whitespace
+        that parsing would strip, is held back.
+        """
+        marker_index = pending.find(_ACTION_MARKER)
+        if marker_index != -1:
+            return pending[:marker_index].rstrip(), "", True
+        cutoff = len(pending[:max(0, len(pending) - len(_ACTION_MARKER) + 1)].rstrip())
+        return pending[:cutoff], pending[cutoff:], False
+
     def start_oracle_streaming_sequence(self, oracle_name: str, player_query: str, 
                                       llm_response_iterator: Iterator[str]) -> Iterator[Dict[str, Any]]:
         """
         Create a complete Oracle streaming sequence with flavor text, waiting text, and LLM response.
-        All character-streamed text will use default_character_delay_ms.
+        All streamed text is yielded in chunks of stream_chunk_size characters
+        and uses default_character_delay_ms per character.
         """
-        # Phase 1: Stream flavor text character by character
-        flavor_texts = self.create_oracle_flavor_text(oracle_name)
-        for flavor_line in flavor_texts:
-            for char in flavor_line:
-                yield self._create_stream_chunk_action(
-                    text=char,
-                    text_type=StreamingTextType.FLAVOR_TEXT,
-                    add_newline=False
-                )
-            # Add newline after the full flavor line (acts like another character)
-            yield self._create_stream_chunk_action(
-                text='\n', 
-                text_type=StreamingTextType.FLAVOR_TEXT,
-                add_newline=False # The text itself is the newline
-            )
-            yield {"action_type": "stream_pause", "details": {"duration_ms": self.inter_chunk_pause_ms}}
+        # Phase 1: Stream flavor text, pausing after each line
+        yield from self._create_line_stream_actions(
+            self.create_oracle_flavor_text(oracle_name),
+            StreamingTextType.FLAVOR_TEXT,
+            pause_ms=self.inter_chunk_pause_ms
+        )
         
-        # Phase 2: Show waiting text character by character
-        waiting_texts = self.create_oracle_waiting_text(oracle_name)
-        for waiting_line in waiting_texts:
-            for char in waiting_line:
-                yield self._create_stream_chunk_action(
-                    text=char,
-                    text_type=StreamingTextType.ORACLE_DIALOGUE,
-                    add_newline=False
-                )
-            # Add newline after the full waiting line
-            yield self._create_stream_chunk_action(
-                text='\n', 
-                text_type=StreamingTextType.ORACLE_DIALOGUE,
-                add_newline=False
-            )
+        # Phase 2: Show waiting text
+        yield from self._create_line_stream_actions(
+            self.create_oracle_waiting_text(oracle_name),
+            StreamingTextType.ORACLE_DIALOGUE
+        )
         
-        # Phase 3: Collect complete LLM response
-        collected_response = ""
+        # Phase 3: Collect the LLM response, streaming legacy narrative as it arrives
+        # A legacy response's narrative is everything before its first ACTION::
+        # marker, so it can be streamed while the LLM is still generating. A
+        # structured JSON response (starting with "{") is only streamed once complete.
+        # Chunks are gathered in a list and joined once; repeated str += would
+        # copy the growing response on every chunk
+        response_chunks: List[str] = []
+        pending_narrative = "" # Received narrative text not yet streamed
+        streamed_length = 0 # Characters of the narrative already streamed
+        live_narrative: Optional[bool] = None # Undecided until the first non-whitespace character
         try:
             for chunk in llm_response_iterator:
                 if chunk and not chunk.startswith("Error:"):
-                    collected_response += chunk
+                    response_chunks.append(chunk)
+                    if live_narrative is False:
+                        continue
+                    pending_narrative += chunk
+                    if live_narrative is None:
+                        pending_narrative = pending_narrative.lstrip()
+                        if not pending_narrative:
+                            continue
+                        live_narrative = not pending_narrative.startswith("{")
+                        if not live_narrative:
+                            pending_narrative = ""
+                            continue
+                    ready_text, pending_narrative, reached_actions = self._split_streamable_narrative(pending_narrative)
+                    if reached_actions:
+                        live_narrative = False
+                    if ready_text:
+                        if not streamed_length:
+                            yield from self._create_oracle_speaks_actions(oracle_name)
+                        yield from self._create_stream_chunk_actions(ready_text, StreamingTextType.ORACLE_DIALOGUE)
+                        streamed_length += len(ready_text)
                 elif chunk and chunk.startswith("Error:"):
+                    if streamed_length:
+                        # Finish the partly streamed narrative line first
+                        yield self._create_stream_chunk_action(text='\n', text_type=StreamingTextType.ORACLE_DIALOGUE, add_newline=False)
                     error_message_text = "The Oracle\'s connection wavers... Please try again."
-                    for char in error_message_text:
-                        yield self._create_stream_chunk_action(
-                            text=char,
-                            text_type=StreamingTextType.ORACLE_DIALOGUE,
-                            add_newline=False,
-                            is_error=True
-                        )
-                    yield self._create_stream_chunk_action(text='\n', text_type=StreamingTextType.ORACLE_DIALOGUE, add_newline=False, is_error=True)
+                    yield from self._create_line_stream_actions([error_message_text], StreamingTextType.ORACLE_DIALOGUE, is_error=True)
                     return # End sequence on LLM error
             
+            collected_response = "".join(response_chunks)
             if collected_response:
                 narrative, actions = self.separate_narrative_from_actions(collected_response)
                 
                 if narrative:
-                    # Phase 4: Stream the narrative response character by character
-                    # Stream "\nOracle speaks:" first, char by char
-                    prefix_text = f"\n{oracle_name} speaks:"
-                    for char in prefix_text:
-                        yield self._create_stream_chunk_action(
-                            text=char,
-                            text_type=StreamingTextType.ORACLE_DIALOGUE,
-                            add_newline=False
-                        )
-                    # Add newline after the prefix
-                    yield self._create_stream_chunk_action(
-                        text='\n',
-                        text_type=StreamingTextType.ORACLE_DIALOGUE,
-                        add_newline=False
-                    )
-                    
-                    # Stream the actual LLM narrative character by character
-                    for char in narrative: 
-                        yield self._create_stream_chunk_action(
-                            text=char,
-                            text_type=StreamingTextType.ORACLE_DIALOGUE,
-                            add_newline=False
-                        )
+                    # Phase 4: Stream the rest of the narrative a chunk at a time
+                    # Whatever was streamed live is always a prefix of the parsed narrative
+                    if not streamed_length:
+                        yield from self._create_oracle_speaks_actions(oracle_name)
+                    yield from self._create_stream_chunk_actions(narrative[streamed_length:], StreamingTextType.ORACLE_DIALOGUE)
                     
                     # Add final newline for the main narrative (explicit 0 delay)
                     yield self._create_stream_chunk_action( 
@@ -330,35 +369,14 @@ class TextStreamingEngine:
                     }
                 else: # Empty LLM response
                     empty_response_text = "The Oracle remains silent, its wisdom beyond words..."
-                    for char in empty_response_text:
-                        yield self._create_stream_chunk_action(
-                            text=char,
-                            text_type=StreamingTextType.ORACLE_DIALOGUE,
-                            add_newline=False,
-                            is_error=True
-                        )
-                    yield self._create_stream_chunk_action(text='\n', text_type=StreamingTextType.ORACLE_DIALOGUE, add_newline=False, is_error=True)
+                    yield from self._create_line_stream_actions([empty_response_text], StreamingTextType.ORACLE_DIALOGUE, is_error=True)
             else: # Empty LLM response
                 empty_response_text = "The Oracle remains silent, its wisdom beyond words..."
-                for char in empty_response_text:
-                    yield self._create_stream_chunk_action(
-                        text=char,
-                        text_type=StreamingTextType.ORACLE_DIALOGUE,
-                        add_newline=False,
-                        is_error=True
-                    )
-                yield self._create_stream_chunk_action(text='\n', text_type=StreamingTextType.ORACLE_DIALOGUE, add_newline=False, is_error=True)
+                yield from self._create_line_stream_actions([empty_response_text], StreamingTextType.ORACLE_DIALOGUE, is_error=True)
                 
         except Exception as e: # Catch-all for other errors during streaming/parsing
             exception_message_text = "The Oracle\'s connection is disrupted by mysterious forces..."
-            for char in exception_message_text:
-                yield self._create_stream_chunk_action(
-                    text=char,
-                    text_type=StreamingTextType.ORACLE_DIALOGUE,
-                    add_newline=False,
-                    is_error=True
-                )
-            yield self._create_stream_chunk_action(text='\n', text_type=StreamingTextType.ORACLE_DIALOGUE, add_newline=False, is_error=True)
+            yield from self._create_line_stream_actions([exception_message_text], StreamingTextType.ORACLE_DIALOGUE, is_error=True)
         
         # Phase 7: Return to awaiting prompt state
         yield {"action_type": "set_oracle_state", "details": {"state": "AWAITING_PROMPT"}}
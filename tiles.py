@@ -68,6 +68,10 @@ class Tile:
                                      of the entity's default color. Set to None
                                      to use the default.
     """
+    # One Tile exists per map cell, so slots keep the grid compact and make the
+    # per-frame attribute reads in rendering and pathfinding cheaper.
+    __slots__ = ("entity", "x", "y", "designated", "highlight_ticks", "flash_ticks", "pulse_ticks", "_color_override")
+
     def __init__(self, entity: GameEntity, x: int, y: int, color_override: int | None = None, designated: bool = False):
         """Initializes a Tile.
 
@@ -80,8 +84,10 @@ class Tile:
 
         Raises:
             TypeError: If the provided `entity` is not an instance of `GameEntity`.
+                       Tiles are created for every map cell, so this check is
+                       skipped when Python runs with -O.
         """
-        if not isinstance(entity, GameEntity):
+        if __debug__ and not isinstance(entity, GameEntity):
              raise TypeError(f"Tile entity must be an instance of GameEntity, got {type(entity)}")
         self.entity = entity
         self.x = x
@@ -148,21 +154,14 @@ class Tile:
     def interact(self, game_state: 'GameState'):
         """Handles player interaction with this tile.
 
-        Delegates the interaction to the `interact` method of the contained
-        `Structure` entity or the `enter` method of a `Sublevel` entity,
-        if applicable. Logs messages for other cases.
+        Delegates to the contained entity's `on_tile_interact`, which a
+        `Structure` maps to its `interact` method and a `Sublevel` to its
+        `enter` method. Other entities just log a message.
 
         Args:
             game_state (GameState): The current game state.
         """
-        if isinstance(self.entity, Structure):
-            self.entity.interact(game_state, self)
-        elif isinstance(self.entity, Sublevel):
-            self.entity.enter(game_state, self)
-        elif self.entity.interactive: # Fallback for generic interactive entities? 
-             game_state.add_debug_message(f"Interacted with {self.entity.name}, but no specific logic handled by Tile.interact.")
-        else:
-            game_state.add_debug_message(f"Nothing to interact with: {self.entity.name}")
+        self.entity.on_tile_interact(game_state, self)
 
 # REMOVED TILE_PROPERTIES dictionary
 # REMOVED redundant InteractiveTile class
@@ -1,5 +1,7 @@
 import heapq
-from typing import List, Tuple, Dict, Optional, TYPE_CHECKING
+from collections import deque
+from functools import lru_cache
+from typing import Callable, List, Tuple, Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .tiles import Tile # Import Tile for type hinting
@@ -8,6 +10,9 @@ if TYPE_CHECKING:
 
 MapGrid = List[List['Tile']] # Use forward reference as string
 
+# 4-connected moves used by the A* searches: down, up, right, left
+_DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
 def wrap_text(text: str, width: int) -> List[str]:
     """Wraps a given string to fit within a specified width.
 
@@ -21,38 +26,46 @@ def wrap_text(text: str, width: int) -> List[str]:
     Returns:
         List[str]: A list of strings, where each string is a line of the wrapped text.
     """
+    # The renderer re-wraps the same descriptions every frame, so results are
+    # memoised; callers get their own list since the cached lines are shared.
+    return list(_wrap_text_cached(text, width))
+
+@lru_cache(maxsize=256)
+def _wrap_text_cached(text: str, width: int) -> Tuple[str, ...]:
+    """Memoised core of `wrap_text`, returning the lines as an immutable tuple."""
     words = text.split()
     lines = []
-    current_line = ""
+    # Words for the line being built are collected and joined once, rather than
+    # concatenated onto a growing string
+    line_words: List[str] = []
+    line_length = 0
     for word in words:
         # Check if the word itself is too long
         if len(word) > width:
             # Simple handling: put the long word on its own line
             # More complex handling could break the word
-            if current_line: # Add the previous line first if it exists
-                lines.append(current_line)
+            if line_words: # Add the previous line first if it exists
+                lines.append(" ".join(line_words))
             lines.append(word)
-            current_line = ""
+            line_words = []
+            line_length = 0
             continue # Move to the next word
             
-        # Check if adding the word (with a preceding space if needed) fits
-        if not current_line: # First word on the line
-            if len(word) <= width:
-                current_line = word
-            else: # Should not happen due to the check above, but defensively
-                 lines.append("") # Should we add an empty line?
-                 current_line = word
-        elif len(current_line) + len(word) + 1 <= width: # +1 for the space
-            current_line += " " + word # Add space BEFORE word
+        # Check if adding the word (with a preceding space) fits
+        if line_words and line_length + len(word) + 1 <= width: # +1 for the space
+            line_words.append(word)
+            line_length += len(word) + 1
         else:
-            # Word doesn't fit, finalize the current line and start a new one
-            lines.append(current_line)
-            current_line = word # Start new line with the current word
+            # First word, or the word doesn't fit: finalize any current line and start a new one
+            if line_words:
+                lines.append(" ".join(line_words))
+            line_words = [word]
+            line_length = len(word)
 
     # Add the last line if it's not empty
-    if current_line:
-        lines.append(current_line)
-    return lines
+    if line_words:
+        lines.append(" ".join(line_words))
+    return tuple(lines)
 
 def a_star(map_grid: MapGrid, start: Tuple[int, int], goal: Tuple[int, int], adjacent: bool = False) -> Optional[List[Tuple[int, int]]]:
     """Finds the shortest path between two points on the map using A*.
@@ -74,19 +87,19 @@ def a_star(map_grid: MapGrid, start: Tuple[int, int], goal: Tuple[int, int], adj
                                         Returns an empty list if start == goal (and not adjacent).
                                         Returns None if no path is found.
     """
-    def heuristic(a, b):
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
     # Handle trivial cases first
-    if not (0 <= start[0] < len(map_grid[0]) and 0 <= start[1] < len(map_grid)):
+    height = len(map_grid)
+    width = len(map_grid[0]) if height else 0
+    start_x, start_y = start
+    if not (0 <= start_x < width and 0 <= start_y < height):
         return None # Start is out of bounds
-    if not map_grid[start[1]][start[0]].walkable:
+    if not map_grid[start_y][start_x].walkable:
          return None # Start is not walkable
          
     if adjacent:
-        # Check if start is already a valid adjacent destination
-        start_dist_to_goal = abs(start[0] - goal[0]) + abs(start[1] - goal[1])
-        if start_dist_to_goal == 1 and map_grid[start[1]][start[0]].walkable: 
+        # Check if start is already a valid adjacent destination (its walkability was checked above)
+        start_dist_to_goal = abs(start_x - goal[0]) + abs(start_y - goal[1])
+        if start_dist_to_goal == 1: 
              # Path consists only of the start node itself, as it's adjacent and walkable
              # The definition asks for path from start (exclusive) to end (inclusive)
              # but in this edge case, the only "step" is staying put, effectively.
@@ -95,44 +108,7 @@ def a_star(map_grid: MapGrid, start: Tuple[int, int], goal: Tuple[int, int], adj
     elif start == goal:
         return []  # No movement needed if start is the goal (and not adjacent mode)
 
-    open_set = [(0, start)]
-    came_from: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {}
-    g_score = {start: 0}
-    f_score = {start: heuristic(start, goal)}
-
-    width, height = len(map_grid[0]), len(map_grid)
-    directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-
-    while open_set:
-        current = heapq.heappop(open_set)[1]
-        if adjacent:
-            # Check if current is adjacent to goal and walkable
-            dist = abs(current[0] - goal[0]) + abs(current[1] - goal[1])
-            if dist == 1 and map_grid[current[1]][current[0]].walkable:
-                path = []
-                while current in came_from:
-                    path.append(current)
-                    current = came_from[current]
-                return path[::-1]
-        elif current == goal:
-            path = []
-            while current in came_from:
-                path.append(current)
-                current = came_from[current]
-            return path[::-1]
-
-        for dx, dy in directions:
-            neighbor = (current[0] + dx, current[1] + dy)
-            if (0 <= neighbor[0] < width and 0 <= neighbor[1] < height and 
-                map_grid[neighbor[1]][neighbor[0]].walkable):
-                tentative_g_score = g_score[current] + 1
-                if tentative_g_score < g_score.get(neighbor, float('inf')):
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g_score
-                    # Use heuristic to goal even for adjacent, to prioritize closer tiles
-                    f_score[neighbor] = tentative_g_score + heuristic(neighbor, goal)
-                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
-    return None
+    return _a_star_search(map_grid, width, height, start, goal, adjacent)
 
 def a_star_for_illumination(map_grid: MapGrid, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
     """Finds the shortest path for illumination, treating water as walkable.
@@ -149,10 +125,9 @@ def a_star_for_illumination(map_grid: MapGrid, start: Tuple[int, int], goal: Tup
                                         Returns an empty list if start == goal.
                                         Returns None if no path is found.
     """
-    def heuristic(a, b):
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-    if not (0 <= start[0] < len(map_grid[0]) and 0 <= start[1] < len(map_grid)):
+    height = len(map_grid)
+    width = len(map_grid[0]) if height else 0
+    if not (0 <= start[0] < width and 0 <= start[1] < height):
         return None
     # For illumination, start tile doesn't strictly need to be walkable by characters
     # if not map_grid[start[1]][start[0]].walkable:
@@ -161,35 +136,60 @@ def a_star_for_illumination(map_grid: MapGrid, start: Tuple[int, int], goal: Tup
     if start == goal:
         return []
 
+    return _a_star_search(map_grid, width, height, start, goal, also_passable=_is_water)
+
+def _is_water(tile: 'Tile') -> bool:
+    """Illumination may cross water, which characters cannot walk on."""
+    return bool(tile.entity and tile.entity.name == "Water")
+
+def _a_star_search(map_grid: MapGrid, width: int, height: int, start: Tuple[int, int], goal: Tuple[int, int],
+                   adjacent: bool = False,
+                   also_passable: Optional[Callable[['Tile'], bool]] = None) -> Optional[List[Tuple[int, int]]]:
+    """The A* search loop shared by `a_star` and `a_star_for_illumination`.
+
+    Callers measure the grid, handle the start-tile checks and trivial cases,
+    and pass the dimensions in. A tile can be
+    entered if it is walkable or, when given, `also_passable(tile)` is true;
+    walkable tiles never pay for that call. In adjacent mode the search ends
+    on a walkable tile next to the goal, as described in `a_star`.
+    """
+    goal_x, goal_y = goal # The Manhattan heuristic is inlined where nodes are pushed
+
     open_set = [(0, start)]
     came_from: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {}
     g_score = {start: 0}
-    f_score = {start: heuristic(start, goal)}
-
-    width, height = len(map_grid[0]), len(map_grid)
-    directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
 
     while open_set:
-        current = heapq.heappop(open_set)[1]
-        if current == goal:
+        priority, current = heapq.heappop(open_set)
+        cx, cy = current
+        # A node pushed again with a lower g-score leaves its older entry in the heap;
+        # that entry's g (priority minus heuristic) exceeds the best known one, so skip it
+        if priority - abs(cx - goal_x) - abs(cy - goal_y) > g_score[current]:
+            continue
+        if adjacent:
+            # Check if current is adjacent to goal and walkable
+            reached = abs(cx - goal_x) + abs(cy - goal_y) == 1 and map_grid[cy][cx].walkable
+        else:
+            reached = current == goal
+        if reached:
             path = []
             while current in came_from:
                 path.append(current)
                 current = came_from[current]
             return path[::-1]
 
-        for dx, dy in directions:
-            neighbor = (current[0] + dx, current[1] + dy)
-            if 0 <= neighbor[0] < width and 0 <= neighbor[1] < height:
-                tile = map_grid[neighbor[1]][neighbor[0]]
-                # MODIFICATION: Allow pathing over water for illumination
-                if tile.walkable or (tile.entity and tile.entity.name == "Water"):
-                    tentative_g_score = g_score[current] + 1
+        tentative_g_score = g_score[current] + 1
+        for dx, dy in _DIRECTIONS:
+            nx, ny = cx + dx, cy + dy
+            if 0 <= nx < width and 0 <= ny < height:
+                tile = map_grid[ny][nx]
+                if tile.walkable or (also_passable is not None and also_passable(tile)):
+                    neighbor = (nx, ny)
                     if tentative_g_score < g_score.get(neighbor, float('inf')):
                         came_from[neighbor] = current
                         g_score[neighbor] = tentative_g_score
-                        f_score[neighbor] = tentative_g_score + heuristic(neighbor, goal)
-                        heapq.heappush(open_set, (f_score[neighbor], neighbor))
+                        # Use heuristic to goal even for adjacent, to prioritize closer tiles
+                        heapq.heappush(open_set, (tentative_g_score + abs(nx - goal_x) + abs(ny - goal_y), neighbor))
     return None
 
 def find_path_on_network(network_graph: Dict[Tuple[int, int], List[Tuple[int, int]]],
@@ -212,18 +212,27 @@ def find_path_on_network(network_graph: Dict[Tuple[int, int], List[Tuple[int, in
     if start_node == end_node:
         return [start_node] # Path to self is just the node itself
 
-    queue: List[Tuple[Tuple[int, int], List[Tuple[int, int]]]] = [(start_node, [start_node])] # (current_node, path_so_far)
-    visited: Set[Tuple[int, int]] = {start_node}
+    # Each visited node records the node it was reached from; the path is only
+    # rebuilt once the end is found, rather than copied along every edge
+    queue = deque([start_node])
+    came_from: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start_node: None}
+    get_neighbors = network_graph.get
 
     while queue:
-        current, path = queue.pop(0)
+        current = queue.popleft()
 
-        for neighbor in network_graph.get(current, []):
+        for neighbor in get_neighbors(current, ()):
             if neighbor == end_node:
-                return path + [neighbor] # Path found
-            if neighbor not in visited:
-                visited.add(neighbor)
-                queue.append((neighbor, path + [neighbor]))
+                # Path found; walk back to the start
+                path = [neighbor]
+                node: Optional[Tuple[int, int]] = current
+                while node is not None:
+                    path.append(node)
+                    node = came_from[node]
+                return path[::-1]
+            if neighbor not in came_from:
+                came_from[neighbor] = current
+                queue.append(neighbor)
     
     return None # No path found
 
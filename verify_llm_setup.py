@@ -5,57 +5,106 @@ Fungi Fortress LLM Setup Verification Tool
 This script helps users verify that their multi-provider LLM configuration is working correctly.
 Run this after setting up your llm_config.ini to confirm everything is configured properly.
 
-Usage: python verify_llm_setup.py
+Usage: python -m fungi_fortress.verify_llm_setup
+       (or python verify_llm_setup.py with the package installed)
 """
 
-import os
-import sys
-sys.path.append('.')
-
-from llm_interface import _detect_provider_and_call_api
-from config_manager import load_llm_config
+from fungi_fortress.llm_interface import _detect_provider_and_call_api
+from fungi_fortress.config_manager import load_llm_config
 import requests
 
+# Shared by the XAI diagnostics so the second request reuses the first's
+# connection instead of doing another TCP and TLS handshake
+_SESSION = requests.Session()
+
+_XAI_CHAT_URL = "https://api.x.ai/v1/chat/completions"
+
+def _xai_headers(api_key):
+    """Builds the request headers for an XAI API call."""
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json"
+    }
+
+# JSON schema response format sent by test_structured_outputs
+_TEST_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "test_response",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "narrative": {
+                    "type": "string",
+                    "description": "A greeting message"
+                },
+                "actions": {
+                    "type": "array",
+                    "description": "Test actions",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "action_type": {"type": "string"},
+                            "details": {"type": "object"}
+                        },
+                        "required": ["action_type", "details"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["narrative", "actions"],
+            "additionalProperties": False
+        }
+    }
+}
+
+# (model_name, provider_hint, expected_provider) cases for verify_provider_detection
+_DETECTION_CASES = (
+    ("grok-3", None, "xai"),
+    ("grok-2-1212", None, "xai"),  
+    ("gpt-4o", None, "openai"),
+    ("gpt-4o-mini", None, "openai"),
+    ("claude-3-5-sonnet-20241022", None, "anthropic"),
+    ("llama-3.3-70b-versatile", None, "groq"),
+    ("mixtral-8x7b-32768", None, "groq"),
+    ("gemma2-9b-it", None, "groq"),
+    ("unknown-model", "xai", "xai"),  # Test explicit provider hint
+)
+
 def verify_provider_detection():
     """Verify that provider detection works correctly for different model names."""
     
-    test_cases = [
-        ("grok-3", None, "xai"),
-        ("grok-2-1212", None, "xai"),  
-        ("gpt-4o", None, "openai"),
-        ("gpt-4o-mini", None, "openai"),
-        ("claude-3-5-sonnet-20241022", None, "anthropic"),
-        ("llama-3.3-70b-versatile", None, "groq"),
-        ("mixtral-8x7b-32768", None, "groq"),
-        ("gemma2-9b-it", None, "groq"),
-        ("unknown-model", "xai", "xai"),  # Test explicit provider hint
-    ]
-    
     print("🔍 Verifying provider detection logic...")
     all_correct = True
     
-    for model_name, provider_hint, expected_provider in test_cases:
-        # Mock the actual API call by using a fake key to test routing only
-        fake_api_key = "test-key-123456789"
-        
+    # dry_run stops before the key check and any API call, so any key will do
+    fake_api_key = "test-key-123456789"
+    
+    for model_name, provider_hint, expected_provider in _DETECTION_CASES:
         print(f"\n📋 Model: {model_name}")
         print(f"   Hint: {provider_hint or 'auto-detect'}")
         print(f"   Expected provider: {expected_provider}")
         
-        # This will fail at the API call level, but we can verify the detection logic
-        # by checking what provider gets selected (visible in printed output)
         try:
-            result = _detect_provider_and_call_api(
+            provider = _detect_provider_and_call_api(
                 "Test prompt", 
                 fake_api_key, 
                 model_name, 
                 provider_hint,
-                None  # oracle_config (use defaults)
+                None,  # oracle_config (use defaults)
+                dry_run=True
             )
-            print(f"   ✅ Detection working (API call failed as expected with fake key)")
         except Exception as e:
             print(f"   ❌ Unexpected error in detection logic: {e}")
             all_correct = False
+            continue
+        
+        if provider == expected_provider:
+            print(f"   ✅ Routed to {provider}")
+        else:
+            print(f"   ❌ Routed to {provider} instead")
+            all_correct = False
     
     return all_correct
 
@@ -82,11 +131,16 @@ def verify_config_structure():
         print(f"   ❌ Error loading configuration: {e}")
         return False
 
-def test_basic_xai_api_call():
-    """Test basic XAI API connectivity without structured outputs."""
+def test_basic_xai_api_call(config=None):
+    """Test basic XAI API connectivity without structured outputs.
+
+    Args:
+        config: An already loaded LLMConfig; loaded from llm_config.ini if None.
+    """
     print("=== Testing XAI API Basic Connectivity ===")
     
-    config = load_llm_config()
+    if config is None:
+        config = load_llm_config()
     
     if not config.api_key or config.api_key == "YOUR_API_KEY_HERE":
         print("❌ No valid API key found in llm_config.ini")
@@ -97,22 +151,20 @@ def test_basic_xai_api_call():
     print(f"✅ Provider: {config.provider}")
     
     # Test simple API call
-    headers = {
-        "Authorization": f"Bearer {config.api_key}",
-        "Content-Type": "application/json"
-    }
+    headers = _xai_headers(config.api_key)
     
     test_data = {
         "messages": [{"role": "user", "content": "Say hello"}],
         "model": config.model_name,
-        "max_tokens": 50,
+        # Only the status matters here, so don't wait for a longer reply
+        "max_tokens": 1,
         "stream": False
     }
     
     try:
         print("🔄 Making test API call...")
-        response = requests.post(
-            "https://api.x.ai/v1/chat/completions",
+        response = _SESSION.post(
+            _XAI_CHAT_URL,
             headers=headers,
             json=test_data,
             timeout=30
@@ -134,16 +186,18 @@ def test_basic_xai_api_call():
         print(f"❌ Exception during API call: {e}")
         return False
 
-def test_structured_outputs():
-    """Test XAI structured outputs feature."""
+def test_structured_outputs(config=None):
+    """Test XAI structured outputs feature.
+
+    Args:
+        config: An already loaded LLMConfig; loaded from llm_config.ini if None.
+    """
     print("\n=== Testing XAI Structured Outputs ===")
     
-    config = load_llm_config()
+    if config is None:
+        config = load_llm_config()
     
-    headers = {
-        "Authorization": f"Bearer {config.api_key}",
-        "Content-Type": "application/json"
-    }
+    headers = _xai_headers(config.api_key)
     
     # Test with JSON schema
     test_data = {
@@ -151,43 +205,13 @@ def test_structured_outputs():
         "model": config.model_name,
         "max_tokens": 100,
         "stream": False,
-        "response_format": {
-            "type": "json_schema",
-            "json_schema": {
-                "name": "test_response",
-                "strict": True,
-                "schema": {
-                    "type": "object",
-                    "properties": {
-                        "narrative": {
-                            "type": "string",
-                            "description": "A greeting message"
-                        },
-                        "actions": {
-                            "type": "array",
-                            "description": "Test actions",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "action_type": {"type": "string"},
-                                    "details": {"type": "object"}
-                                },
-                                "required": ["action_type", "details"],
-                                "additionalProperties": False
-                            }
-                        }
-                    },
-                    "required": ["narrative", "actions"],
-                    "additionalProperties": False
-                }
-            }
-        }
+        "response_format": _TEST_RESPONSE_FORMAT
     }
     
     try:
         print("🔄 Making structured output test...")
-        response = requests.post(
-            "https://api.x.ai/v1/chat/completions",
+        response = _SESSION.post(
+            _XAI_CHAT_URL,
             headers=headers,
             json=test_data,
             timeout=30
@@ -215,12 +239,15 @@ def main():
     print("🧪 Fungi Fortress LLM Diagnostics")
     print("=" * 50)
     
+    # Both tests use the same config, so read llm_config.ini once
+    config = load_llm_config()
+    
     # Test basic connectivity
-    basic_success = test_basic_xai_api_call()
+    basic_success = test_basic_xai_api_call(config)
     
     if basic_success:
         # If basic works, test structured outputs
-        structured_success = test_structured_outputs()
+        structured_success = test_structured_outputs(config)
         
         if not structured_success:
             print("\n⚠️  Basic API works but structured outputs failed.")